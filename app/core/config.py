@@ -3,10 +3,87 @@ from pydantic import Field
 
 class Settings(BaseSettings):
     postgres_url: str
+    postgres_replica_url: str | None = Field(default=None, alias="POSTGRES_REPLICA_URL")
+    debug: bool = Field(default=False, alias="DEBUG")
 
     jwt_secret: str = Field(alias="SECRET_KEY")
     jwt_alg: str = Field(default="HS256", alias="ALGORITHM")
     jwt_expire_min: int = Field(default=30, alias="ACCESS_TOKEN_EXPIRE_MINUTES")
+    refresh_token_expire_days: int = Field(default=14, alias="REFRESH_TOKEN_EXPIRE_DAYS")
+    token_cache_max_size: int = Field(default=10_000, alias="TOKEN_CACHE_MAX_SIZE")
+    # Clave del HMAC de las API keys; sin valor se usa SECRET_KEY
+    api_key_secret: str | None = Field(default=None, alias="API_KEY_SECRET")
+    token_revocation_sync_seconds: float = Field(default=5.0, alias="TOKEN_REVOCATION_SYNC_SECONDS")
+    # Cada cuanto se borran los refresh tokens y revocaciones vencidos
+    token_purge_seconds: float = Field(default=3600.0, alias="TOKEN_PURGE_SECONDS")
+
+    # Modo sin estado: confiar en los claims de tokens de vida corta
+    auth_stateless_claims: bool = Field(default=False, alias="AUTH_STATELESS_CLAIMS")
+    auth_stateless_max_token_min: int = Field(default=15, alias="AUTH_STATELESS_MAX_TOKEN_MINUTES")
+
+    # Parametros de Argon2id (scripts/calibrate_argon2.py propone valores)
+    argon2_time_cost: int = Field(default=3, alias="ARGON2_TIME_COST")
+    argon2_memory_cost: int = Field(default=65536, alias="ARGON2_MEMORY_COST")  # KiB
+    argon2_parallelism: int = Field(default=4, alias="ARGON2_PARALLELISM")
+
+    # Executor dedicado para Argon2 (thread | process)
+    password_hash_executor: str = Field(default="thread", alias="PASSWORD_HASH_EXECUTOR")
+    password_hash_workers: int = Field(default=4, alias="PASSWORD_HASH_WORKERS")
+    password_hash_max_queue: int = Field(default=32, alias="PASSWORD_HASH_MAX_QUEUE")
+
+    # Control de admision del login (token buckets por IP y por email)
+    login_ip_rate_per_min: float = Field(default=30, alias="LOGIN_IP_RATE_PER_MIN")
+    login_ip_burst: int = Field(default=10, alias="LOGIN_IP_BURST")
+    login_email_rate_per_min: float = Field(default=5, alias="LOGIN_EMAIL_RATE_PER_MIN")
+    login_email_burst: int = Field(default=5, alias="LOGIN_EMAIL_BURST")
+    login_max_in_flight: int = Field(default=16, alias="LOGIN_MAX_IN_FLIGHT")
+    login_throttle_max_keys: int = Field(default=100_000, alias="LOGIN_THROTTLE_MAX_KEYS")
+
+    # Cache de usuarios autenticados
+    principal_cache_ttl_seconds: int = Field(default=60, alias="PRINCIPAL_CACHE_TTL_SECONDS")
+    principal_cache_max_size: int = Field(default=10_000, alias="PRINCIPAL_CACHE_MAX_SIZE")
+
+    # Pool de conexiones del engine asincrono
+    db_pool_size: int = Field(default=5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(default=30.0, alias="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(default=1800, alias="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    db_warmup_connections: int = Field(default=2, alias="DB_WARMUP_CONNECTIONS")
+    db_pgbouncer_mode: bool = Field(default=False, alias="DB_PGBOUNCER_MODE")
+    db_read_your_writes_seconds: int = Field(default=5, alias="DB_READ_YOUR_WRITES_SECONDS")
+
+    # Parametros de Postgres por conexion y por perfil de carga
+    db_application_name: str = Field(default="begamer-api", alias="DB_APPLICATION_NAME")
+    db_reporting_work_mem: str = Field(default="64MB", alias="DB_REPORTING_WORK_MEM")
+
+    # statement_timeout por tipo de ruta (milisegundos)
+    db_timeout_public_ms: int = Field(default=2000, alias="DB_TIMEOUT_PUBLIC_MS")
+    db_timeout_search_ms: int = Field(default=1000, alias="DB_TIMEOUT_SEARCH_MS")
+    db_timeout_admin_ms: int = Field(default=15000, alias="DB_TIMEOUT_ADMIN_MS")
+
+    # Busqueda tolerante a errores (pg_trgm): umbral de word_similarity y
+    # topes de filas para que el reintento quede dentro de DB_TIMEOUT_SEARCH_MS
+    search_fuzzy_threshold: float = Field(default=0.5, alias="SEARCH_FUZZY_THRESHOLD")
+    search_fuzzy_max_results: int = Field(default=20, alias="SEARCH_FUZZY_MAX_RESULTS")
+    search_suggest_max_results: int = Field(default=10, alias="SEARCH_SUGGEST_MAX_RESULTS")
+
+    # Indice de prefijos en memoria para /catalog/autocomplete
+    autocomplete_sync_seconds: float = Field(default=5.0, alias="AUTOCOMPLETE_SYNC_SECONDS")
+    autocomplete_rebuild_seconds: float = Field(default=300.0, alias="AUTOCOMPLETE_REBUILD_SECONDS")
+
+    # Lecturas del catalogo con prepared statements de asyncpg
+    catalog_fast_path: bool = Field(default=False, alias="CATALOG_FAST_PATH")
+
+    # Totales de los listados (?count=exact|estimate)
+    count_cache_ttl_seconds: int = Field(default=30, alias="COUNT_CACHE_TTL_SECONDS")
+    count_cache_max_size: int = Field(default=1000, alias="COUNT_CACHE_MAX_SIZE")
+    # Con filtros, ?count=estimate solo estima desde este total esperado
+    count_estimate_min_rows: int = Field(default=10000, alias="COUNT_ESTIMATE_MIN_ROWS")
+
+    # Instrumentacion SQL
+    db_echo: bool = Field(default=False, alias="DB_ECHO")
+    db_slow_query_ms: int = Field(default=200, alias="DB_SLOW_QUERY_MS")
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -0,0 +1,104 @@
+import json
+from typing import Hashable, Literal
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from fastapi import Response
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.db import apply_db_profile
+
+# Opt-in en los listados: ?count=exact | ?count=estimate
+CountMode = Literal["exact", "estimate"]
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+TOTAL_COUNT_KIND_HEADER = "X-Total-Count-Kind"
+
+# Totales por (modo, tabla, filtros). Un TTL corto alcanza para la UI de
+# paginacion y evita recontar en cada pagina.
+count_cache = TTLCache(
+    max_size=settings.count_cache_max_size,
+    ttl=settings.count_cache_ttl_seconds
+)
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) de un SELECT, con sus parametros enlazados"""
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def count_rows(
+    session: AsyncSession,
+    query: Select,
+    mode: CountMode,
+    table: str,
+    filters: Hashable
+) -> tuple[int, CountMode]:
+    """
+    Total de filas de un listado y el tipo de conteo que se hizo. query es
+    el SELECT ya filtrado, sin orden, offset ni limit. exact cuenta de
+    verdad. estimate usa reltuples si no hay filtros; con filtros solo usa
+    el EXPLAIN cuando el planner espera mas de COUNT_ESTIMATE_MIN_ROWS filas,
+    si no cuenta de verdad y devuelve "exact".
+    """
+    key = (mode, table, filters)
+    cached = count_cache.get(key)
+    if cached is not None:
+        return cached
+
+    counted = None
+    if mode == "estimate":
+        counted = await _estimated_count(session, query, table)
+    if counted is None:
+        counted = (await _exact_count(session, query), "exact")
+
+    count_cache.set(key, counted)
+    return counted
+
+
+async def _exact_count(session: AsyncSession, query: Select) -> int:
+    # Contar con filtros agrega sobre muchas filas: perfil reporting (work_mem)
+    await apply_db_profile(session, "reporting")
+    statement = select(func.count()).select_from(query.order_by(None).subquery())
+    result = await session.execute(statement)
+    return int(result.scalar_one())
+
+
+async def _estimated_count(session: AsyncSession, query: Select, table: str) -> tuple[int, CountMode] | None:
+    """Estimado del planner, o None cuando conviene contar de verdad"""
+    if query.whereclause is None:
+        result = await session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": table}
+        )
+        estimate = result.scalar_one_or_none()
+        # -1: la tabla nunca fue analizada, no hay estadisticas
+        if estimate is not None and estimate >= 0:
+            return int(estimate), "estimate"
+        return None
+
+    # Con filtros el planner puede errar por ordenes de magnitud en
+    # resultados chicos (un is_active + una marca). Solo vale la pena
+    # estimar cuando el conteo exacto seria caro.
+    result = await session.execute(_Explain(query.order_by(None)))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    if estimate >= settings.count_estimate_min_rows:
+        return estimate, "estimate"
+    return None
+
+
+def set_total_count(response: Response, total: int, mode: CountMode) -> None:
+    response.headers[TOTAL_COUNT_HEADER] = str(total)
+    response.headers[TOTAL_COUNT_KIND_HEADER] = mode
@@ -1,9 +1,107 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+import asyncio
+import logging
+import uuid
+from contextlib import AsyncExitStack
+from contextvars import ContextVar
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
 from sqlmodel.ext.asyncio.session import AsyncSession
 from app.core.config import settings
+from app.core.pool import InstrumentedPool
+from app.core.query_stats import instrument_engine
 
+logger = logging.getLogger(__name__)
 
-engine = create_async_engine(settings.postgres_url, echo=True)
+# Cookie que marca a un cliente que acaba de escribir en la primaria
+READ_YOUR_WRITES_COOKIE = "db_primary"
+
+
+# Perfiles de parametros de Postgres por tipo de carga
+DB_PROFILES: dict[str, dict[str, str]] = {
+    # Lecturas cortas por PK o indice: el JIT cuesta mas de lo que ahorra
+    "oltp": {"jit": "off"},
+    # Exportaciones y agregaciones (conteos, facetas): mas memoria para sorts y hashes
+    "reporting": {"work_mem": settings.db_reporting_work_mem},
+}
+
+# Perfil fijo de todas las conexiones. Sin PgBouncer va en server_settings
+# al conectar y no cuesta nada por transaccion; con PgBouncer (que no deja
+# pasar parametros de arranque) se aplica con SET LOCAL como los demas
+CONNECT_PROFILE = "oltp"
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def _pool_options(pgbouncer_mode: bool) -> dict:
+    """
+    Perfil del pool segun donde se conecta la aplicacion.
+
+    Con PgBouncer en modo transaccion (DB_PGBOUNCER_MODE=true) cada
+    transaccion puede caer en un backend distinto, por lo que:
+    - El pool lo maneja PgBouncer: del lado de la app se usa NullPool.
+    - Se desactivan los caches de prepared statements de asyncpg y de
+      SQLAlchemy, y los que igual se crean llevan nombres unicos para
+      no chocar entre backends.
+    - No se puede depender de estado de sesion (SET, tablas temporales,
+      advisory locks de sesion): solo SET LOCAL dentro de la transaccion.
+    """
+    if pgbouncer_mode:
+        return {
+            "poolclass": NullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": _unique_statement_name,
+            },
+        }
+
+    return {
+        "poolclass": InstrumentedPool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def _server_settings(pgbouncer_mode: bool) -> dict[str, str]:
+    # Hook de conexion: parametros fijos enviados al abrir cada conexion.
+    # application_name es de los pocos que PgBouncer acepta al conectar.
+    server_settings = {"application_name": settings.db_application_name}
+    if not pgbouncer_mode:
+        server_settings.update(DB_PROFILES[CONNECT_PROFILE])
+    return server_settings
+
+
+def build_engine(url: str, pgbouncer_mode: bool = settings.db_pgbouncer_mode) -> AsyncEngine:
+    options = _pool_options(pgbouncer_mode)
+
+    connect_args = options.setdefault("connect_args", {})
+    connect_args["server_settings"] = _server_settings(pgbouncer_mode)
+
+    new_engine = create_async_engine(
+        url,
+        echo=settings.db_echo,
+        **options
+    )
+    instrument_engine(new_engine)
+    return new_engine
+
+
+engine = build_engine(settings.postgres_url)
+
+# Sin replica configurada las lecturas van a la primaria
+replica_engine = (
+    build_engine(settings.postgres_replica_url)
+    if settings.postgres_replica_url
+    else engine
+)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -12,10 +110,156 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False
 )
 
+# Las sesiones de lectura abren transacciones READ ONLY
+ReadSessionLocal = async_sessionmaker(
+    bind=replica_engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False
+)
+
+PrimaryReadSessionLocal = async_sessionmaker(
+    bind=engine.execution_options(postgresql_readonly=True),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False
+)
+
+
+async def warm_up_pool(target: AsyncEngine, connections: int) -> None:
+    """
+    Abre varias conexiones a la vez y ejecuta una consulta trivial en cada
+    una, para que las primeras peticiones no paguen TCP + TLS + auth.
+    Al salir las conexiones quedan libres en el pool.
+    """
+    if not isinstance(target.pool, InstrumentedPool):
+        return
+
+    connections = min(connections, settings.db_pool_size)
+    if connections <= 0:
+        return
+
+    try:
+        async with AsyncExitStack() as stack:
+            conns = await asyncio.gather(*(
+                stack.enter_async_context(target.connect())
+                for _ in range(connections)
+            ))
+            await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in conns))
+    except Exception as e:
+        # Sin BD al arrancar la app igual levanta, el pool se llenara bajo demanda
+        logger.warning(f"Pool warm-up failed: {e}")
+        return
+
+    logger.info(f"Pool warm-up: {connections} connections ready")
+
+
+_transaction_settings: ContextVar[dict[str, str] | None] = ContextVar(
+    "transaction_settings", default=None
+)
+
+
+def set_transaction_setting(name: str, value: str) -> None:
+    """
+    Registra un parametro de Postgres (GUC) que se aplicara con alcance
+    SET LOCAL a cada transaccion que abra la peticion en curso.
+    """
+    current = dict(_transaction_settings.get() or {})
+    current[name] = value
+    _transaction_settings.set(current)
+
+
+def _set_config_statement(values: dict[str, str]):
+    # set_config(..., true) equivale a SET LOCAL pero admite parametros,
+    # y al ser local a la transaccion no deja estado en la conexion
+    calls = ", ".join(
+        f"set_config(:name_{i}, :value_{i}, true)" for i in range(len(values))
+    )
+    params = {}
+    for i, (name, value) in enumerate(values.items()):
+        params[f"name_{i}"] = name
+        params[f"value_{i}"] = value
+
+    return text(f"SELECT {calls}"), params
+
+
+@event.listens_for(Session, "after_begin")
+def _apply_transaction_settings(session, transaction, connection):
+    pending = _transaction_settings.get()
+    if not pending:
+        return
+
+    statement, params = _set_config_statement(pending)
+    connection.execute(statement, params)
+
+
+def _profile_values(profile: str, route_class: str | None) -> dict[str, str]:
+    if profile not in DB_PROFILES:
+        raise ValueError(f"Unknown DB profile '{profile}'")
+
+    values = {}
+    if profile != CONNECT_PROFILE or settings.db_pgbouncer_mode:
+        values.update(DB_PROFILES[profile])
+    if route_class:
+        # Permite identificar el origen de cada consulta en pg_stat_activity
+        values["application_name"] = f"{settings.db_application_name}:{route_class}"
+    return values
+
+
+def use_db_profile(profile: str, route_class: str | None = None) -> None:
+    """Aplica un perfil a las transacciones que abra la peticion en curso"""
+    for name, value in _profile_values(profile, route_class).items():
+        set_transaction_setting(name, value)
+
+
+async def apply_db_profile(
+    session: AsyncSession,
+    profile: str,
+    route_class: str | None = None
+) -> None:
+    """
+    Para repositorios: aplica un perfil aunque la sesion ya tenga una
+    transaccion abierta (ej. antes de una agregacion pesada).
+    """
+    values = _profile_values(profile, route_class)
+    for name, value in values.items():
+        set_transaction_setting(name, value)
+
+    # Si aun no hay transaccion, after_begin lo aplicara al abrirla
+    if values and session.in_transaction():
+        statement, params = _set_config_statement(values)
+        await session.execute(statement, params)
+
+
+class WriteMarker:
+    """Indica si la peticion en curso escribio algo en la base de datos"""
+
+    def __init__(self) -> None:
+        self.wrote = False
+
+
+_write_marker: ContextVar[WriteMarker | None] = ContextVar("write_marker", default=None)
+
+
+def start_write_tracking() -> WriteMarker:
+    marker = WriteMarker()
+    _write_marker.set(marker)
+    return marker
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_write(session, flush_context):
+    # Un flush solo ocurre cuando hay cambios pendientes
+    marker = _write_marker.get()
+    if marker is not None:
+        marker.wrote = True
 
 
 #Dependencia de sesiones
 async def get_db():
+    # La sesion pide la conexion al pool recien en la primera consulta.
+    # Si la peticion falla antes (ej. 401 por token invalido) el commit y el
+    # rollback no tienen transaccion real que cerrar y el pool no se toca.
     async with AsyncSessionLocal() as session:
         try:
             yield session
@@ -24,4 +268,16 @@ async def get_db():
             await session.rollback()
             raise
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+#Dependencia de sesiones de solo lectura (replica)
+async def get_read_db(request: Request):
+    # Read-your-writes: quien acaba de escribir sigue leyendo de la primaria
+    recent_write = READ_YOUR_WRITES_COOKIE in request.cookies
+    session_factory = PrimaryReadSessionLocal if recent_write else ReadSessionLocal
+
+    # Nunca hace flush ni commit: al cerrar la sesion la transaccion
+    # READ ONLY se descarta con un rollback y la conexion vuelve al pool
+    async with session_factory() as session:
+        yield session
@@ -1,29 +1,114 @@
 from fastapi.security import HTTPAuthorizationCredentials
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from app.modules.auth.models import User
+from app.modules.auth.schemas import Principal
 from app.core.config import settings
-from app.core.security import http_bearer, http_bearer_optional
-from app.modules.auth import repository as repo
-from app.core.db import get_db
+from app.core.security import (
+    http_bearer,
+    http_bearer_optional,
+    api_key_header,
+    decode_access_token,
+    hash_api_key
+)
+from app.modules.auth import cache as auth_cache
+from app.modules.auth import repository as auth_repo
+from app.modules.auth.revocation import revocation_list
+from app.core.db import get_db, get_read_db, set_transaction_setting, use_db_profile
+from app.core.pagination import decode_cursor, InvalidCursorError
+from datetime import datetime
 from typing import Annotated
 from sqlmodel.ext.asyncio.session import AsyncSession
 import jwt
+import uuid
 import uuid6
 
 SessionDep = Annotated[AsyncSession, Depends(get_db)]
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_db)]
+
+
+def statement_timeout(timeout_ms: int):
+    """
+    Dependencia que fija statement_timeout (SET LOCAL) para las consultas
+    de la peticion. Si se declara a nivel de router y de ruta, gana la ruta.
+    """
+    async def _set_statement_timeout() -> None:
+        set_transaction_setting("statement_timeout", str(timeout_ms))
+
+    return Depends(_set_statement_timeout)
 
-async def get_current_user(
-    session: SessionDep,
-    token_auth: HTTPAuthorizationCredentials = Depends(http_bearer)
-) -> User:
-    token = token_auth.credentials
 
+async def _search_statement_timeout(search: str | None = None) -> None:
+    if search:
+        set_transaction_setting("statement_timeout", str(settings.db_timeout_search_ms))
+        # Umbral del operador <% de pg_trgm (reintento por similitud)
+        set_transaction_setting("pg_trgm.word_similarity_threshold", str(settings.search_fuzzy_threshold))
+
+
+PublicTimeout = statement_timeout(settings.db_timeout_public_ms)
+AdminTimeout = statement_timeout(settings.db_timeout_admin_ms)
+SearchTimeout = Depends(_search_statement_timeout)
+
+
+async def _page_cursor(cursor: str | None = Query(default=None)) -> tuple[datetime, uuid.UUID] | None:
+    if cursor is None:
+        return None
     try:
-        payload = jwt.decode(
-            token, 
-            settings.jwt_secret, 
-            algorithms=[settings.jwt_alg]
-            )
+        return decode_cursor(cursor)
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+# Paginacion keyset: ?cursor=<X-Next-Cursor de la pagina anterior>
+PageCursor = Annotated[tuple[datetime, uuid.UUID] | None, Depends(_page_cursor)]
+
+
+def db_profile(profile: str, route_class: str):
+    """
+    Dependencia que elige el perfil de parametros de Postgres (ver
+    DB_PROFILES) y etiqueta application_name con la clase de ruta.
+    """
+    async def _use_db_profile() -> None:
+        use_db_profile(profile, route_class)
+
+    return Depends(_use_db_profile)
+
+
+CatalogProfile = db_profile("oltp", "catalog")
+AdminProfile = db_profile("oltp", "catalog-admin")
+AuthProfile = db_profile("oltp", "auth")
+
+def _principal_from_claims(payload: dict, user_uuid: uuid.UUID) -> Principal | None:
+    """
+    Modo sin estado (AUTH_STATELESS_CLAIMS): confia en los claims firmados
+    de tokens de vida corta. Devuelve None si el token no califica y hay
+    que consultar la BD.
+    """
+    if not settings.auth_stateless_claims:
+        return None
+
+    issued_at = payload.get("iat")
+    expires_at = payload.get("exp")
+    if issued_at is None or expires_at is None:
+        return None
+
+    if expires_at - issued_at > settings.auth_stateless_max_token_min * 60:
+        return None
+
+    if "role" not in payload or "is_active" not in payload:
+        return None
+
+    return Principal(
+        user_id=user_uuid,
+        role=payload["role"],
+        is_active=payload["is_active"]
+    )
+
+
+def _decode_token(token: str) -> tuple[dict, uuid.UUID]:
+    try:
+        payload = decode_access_token(token)
         user_id_str = payload.get("sub")
 
         if user_id_str is None:
@@ -34,6 +119,13 @@ async def get_current_user(
 
         user_uuid = uuid6.UUID(user_id_str)
 
+        # Lookup en memoria; la lista se sincroniza en segundo plano
+        if revocation_list.is_revoked(payload.get("jti")):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Revoked token"
+                )
+
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -45,8 +137,12 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED, 
             detail="Invalid token"
         )
-        
-    user = await repo.get_user_by_id(session, user_uuid)
+
+    return payload, user_uuid
+
+
+async def _load_user(session: AsyncSession, user_uuid: uuid.UUID) -> User:
+    user = await auth_repo.get_user_by_id(session, user_uuid)
 
     if not user:
         raise HTTPException(
@@ -56,11 +152,60 @@ async def get_current_user(
     
     return user
 
+
+async def _load_principal(session: AsyncSession, user_uuid: uuid.UUID) -> Principal:
+    principal = await auth_cache.get_principal(session, user_uuid)
+
+    if not principal:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found"
+            )
+
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Inactive user"
+        )
+    return principal
+
+
+async def get_current_user(
+    session: SessionDep,
+    token_auth: HTTPAuthorizationCredentials = Depends(http_bearer)
+) -> User:
+    _, user_uuid = _decode_token(token_auth.credentials)
+    return await _load_user(session, user_uuid)
+
 CurrentUser = Annotated[User, Depends(get_current_user)]
 
+
+async def get_current_principal(
+    session: SessionDep,
+    token_auth: HTTPAuthorizationCredentials = Depends(http_bearer)
+) -> Principal:
+    """
+    Identidad del usuario para chequeos de rol. En modo sin estado evita
+    la consulta a la BD; las rutas que necesiten el User completo deben
+    usar CurrentUser.
+    """
+    payload, user_uuid = _decode_token(token_auth.credentials)
+
+    principal = _principal_from_claims(payload, user_uuid)
+    if principal is None:
+        return await _load_principal(session, user_uuid)
+
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Inactive user"
+        )
+    return principal
+
+
 async def get_current_admin(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: Principal = Depends(get_current_principal)
+) -> Principal:
     if current_user.role != "admin":
         raise HTTPException(
             status_code=403,
@@ -68,42 +213,67 @@ async def get_current_admin(
         )
     return current_user
 
-CurrentAdmin = Annotated[User, Depends(get_current_admin)]
+CurrentAdmin = Annotated[Principal, Depends(get_current_admin)]
 
 
-async def get_current_user_optional(
+async def _api_key_principal(session: AsyncSession, api_key: str, scope: str) -> Principal:
+    stored = await auth_cache.get_api_key(session, hash_api_key(api_key))
+
+    if not stored or not stored.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API key"
+        )
+
+    if scope not in stored.scopes.split():
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="API key scope does not allow this operation"
+        )
+
+    return Principal(user_id=stored.key_id, role="service", is_active=True)
+
+
+async def get_catalog_writer(
     session: SessionDep,
-    token_auth: HTTPAuthorizationCredentials = Depends(http_bearer_optional)
-) -> User | None:
-    if not token_auth:
-        return None
+    api_key: str | None = Depends(api_key_header),
+    token_auth: HTTPAuthorizationCredentials | None = Depends(http_bearer_optional)
+) -> Principal:
+    """
+    Rutas de escritura del catalogo: un admin con JWT o una integracion
+    con API key (cabecera X-API-Key) con scope catalog:write.
+    """
+    if api_key is not None:
+        return await _api_key_principal(session, api_key, "catalog:write")
 
-    token = token_auth.credentials
+    if token_auth is None:
+        raise http_bearer.make_not_authenticated_error()
 
-    try:
-        payload = jwt.decode(
-            token, 
-            settings.jwt_secret, 
-            algorithms=[settings.jwt_alg]
-            )
-        user_id_str = payload.get("sub")
+    principal = await get_current_principal(session, token_auth)
+    return await get_current_admin(principal)
 
-        if user_id_str is None:
-            return None
+CatalogWriter = Annotated[Principal, Depends(get_catalog_writer)]
 
-        user_uuid = uuid6.UUID(user_id_str)
 
-    except jwt.ExpiredSignatureError:
+async def get_current_user_optional(
+    session: ReadSessionDep,
+    token_auth: HTTPAuthorizationCredentials = Depends(http_bearer_optional)
+) -> Principal | None:
+    if not token_auth:
         return None
-    
-    except jwt.InvalidTokenError: 
+
+    try:
+        payload, user_uuid = _decode_token(token_auth.credentials)
+    except HTTPException:
         return None
-        
-    user = await repo.get_user_by_id(session, user_uuid)
 
-    if not user:
+    principal = _principal_from_claims(payload, user_uuid)
+    if principal is not None:
+        return principal if principal.is_active else None
+
+    principal = await auth_cache.get_principal(session, user_uuid)
+    if principal is not None and not principal.is_active:
         return None
-    
-    return user
+    return principal
 
-CurrentUserOptional = Annotated[User | None, Depends(get_current_user_optional)]
+CurrentUserOptional = Annotated[Principal | None, Depends(get_current_user_optional)]
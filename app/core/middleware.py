@@ -0,0 +1,126 @@
+import asyncio
+import logging
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.core.db import READ_YOUR_WRITES_COOKIE, start_write_tracking
+from app.core.query_stats import start_request_stats
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """
+    Mide las consultas SQL de cada peticion HTTP. En modo debug agrega
+    los headers X-DB-Queries / X-DB-Time y avisa de posibles N+1.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = start_request_stats()
+
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start" and settings.debug:
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Queries"] = str(stats.count)
+                headers["X-DB-Time"] = f"{stats.total_time * 1000:.2f}ms"
+            await send(message)
+
+        await self.app(scope, receive, send_with_stats)
+
+        if settings.debug:
+            for statement, times in stats.repeated_statements():
+                logger.warning(
+                    "Possible N+1 on %s %s: %d executions of %s",
+                    scope["method"], scope["path"], times, statement
+                )
+
+
+class ReadYourWritesMiddleware:
+    """
+    Cuando una peticion escribe en la primaria, marca al cliente con una
+    cookie de vida corta para que sus siguientes lecturas no vayan a la
+    replica mientras esta se pone al dia.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        window = settings.db_read_your_writes_seconds
+        if scope["type"] != "http" or window <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        marker = start_write_tracking()
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and marker.wrote:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "set-cookie",
+                    f"{READ_YOUR_WRITES_COOKIE}=1; Max-Age={window}; Path=/; HttpOnly; SameSite=Lax"
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+class CancelOnDisconnectMiddleware:
+    """
+    Cancela las peticiones GET cuyo cliente se desconecto antes de recibir
+    la respuesta. La cancelacion llega hasta asyncpg, que aborta la consulta
+    en curso en Postgres en vez de dejarla correr para nadie.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Solo lecturas: cancelar una escritura a medias no es seguro
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        messages: asyncio.Queue[Message] = asyncio.Queue()
+        response_started = False
+        disconnected = False
+
+        async def queued_receive() -> Message:
+            return await messages.get()
+
+        async def tracked_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        app_task = asyncio.ensure_future(self.app(scope, queued_receive, tracked_send))
+
+        async def watch_disconnect() -> None:
+            nonlocal disconnected
+            while True:
+                message = await receive()
+                await messages.put(message)
+                if message["type"] == "http.disconnect":
+                    # Si la respuesta ya empezo se deja terminar
+                    if not response_started:
+                        disconnected = True
+                        app_task.cancel()
+                    return
+
+        watcher = asyncio.ensure_future(watch_disconnect())
+        try:
+            await app_task
+        except asyncio.CancelledError:
+            if not disconnected:
+                raise
+            logger.info(f"Client disconnected, cancelled {scope['method']} {scope['path']}")
+        finally:
+            watcher.cancel()
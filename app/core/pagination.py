@@ -0,0 +1,36 @@
+import base64
+import json
+import uuid
+from datetime import datetime
+
+# Cabecera con el cursor de la pagina siguiente. El cuerpo de los listados
+# sigue siendo una lista para no romper a los clientes que usan offset.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    """Se lanza cuando el cursor no fue emitido por la API o esta corrupto"""
+    pass
+
+
+def encode_cursor(created_at: datetime, item_id: uuid.UUID) -> str:
+    """Cursor opaco con la clave de orden (created_at, id) del ultimo item"""
+    raw = json.dumps([created_at.isoformat(), str(item_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), uuid.UUID(item_id)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def next_cursor(items: list, limit: int, id_attr: str) -> str | None:
+    """Cursor de la pagina siguiente, o None si esta fue la ultima"""
+    if limit == 0 or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(last.created_at, getattr(last, id_attr))
@@ -0,0 +1,78 @@
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+
+class PoolMetrics:
+    """
+    Contadores acumulados del pool desde que arranco el proceso.
+    Los tiempos se guardan en segundos.
+    """
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.overflow_events = 0
+        self.timeouts = 0
+
+    def record_checkout(self, wait: float, overflowed: bool) -> None:
+        self.checkouts += 1
+        self.wait_total += wait
+        if wait > self.wait_max:
+            self.wait_max = wait
+        if overflowed:
+            self.overflow_events += 1
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool que mide cuanto espera cada checkout y cuantas
+    veces se tuvo que abrir una conexion de overflow.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        overflow_before = self._overflow
+        start = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+
+        # Solo cuenta como overflow si se abrio una conexion por sobre pool_size
+        overflowed = self._overflow > overflow_before and self._overflow > 0
+        self.metrics.record_checkout(time.perf_counter() - start, overflowed)
+        return record
+
+
+def pool_stats(pool: Pool) -> dict:
+    """
+    Foto del estado actual del pool: conexiones en uso, libres y metricas
+    acumuladas. Los pools sin instrumentar solo reportan su tipo.
+    """
+    if not isinstance(pool, InstrumentedPool):
+        return {"pool": type(pool).__name__}
+
+    metrics = pool.metrics
+    avg_wait = metrics.wait_total / metrics.checkouts if metrics.checkouts else 0.0
+
+    return {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "in_use": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "checkouts": metrics.checkouts,
+        "checkout_wait_avg_ms": round(avg_wait * 1000, 3),
+        "checkout_wait_max_ms": round(metrics.wait_max * 1000, 3),
+        "overflow_events": metrics.overflow_events,
+        "timeouts": metrics.timeouts,
+    }
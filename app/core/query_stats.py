@@ -0,0 +1,84 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# A partir de cuantas repeticiones de la misma sentencia se sospecha de un N+1
+REPEATED_QUERY_THRESHOLD = 5
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_POSITIONAL_PARAM = re.compile(r"\$\d+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryStats:
+    """Acumula las consultas ejecutadas durante una peticion"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.total_time += duration
+        if duration > self.max_time:
+            self.max_time = duration
+        self.statements[statement] += 1
+
+    def repeated_statements(self) -> list[tuple[str, int]]:
+        return [
+            (statement, times)
+            for statement, times in self.statements.most_common()
+            if times >= REPEATED_QUERY_THRESHOLD
+        ]
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_request_stats() -> QueryStats:
+    stats = QueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Reemplaza literales y parametros por '?' y colapsa espacios,
+    para que la misma consulta con distintos valores cuente como una sola.
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _POSITIONAL_PARAM.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - context._query_start_time
+    normalized = normalize_statement(statement)
+
+    if duration * 1000 >= settings.db_slow_query_ms:
+        logger.warning("Slow query (%.1f ms): %s", duration * 1000, normalized)
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(normalized, duration)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Registra los listeners de medicion sobre el engine sincrono subyacente"""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,91 @@
+import time
+from collections import OrderedDict
+from typing import Hashable
+
+
+class TokenBucketLimiter:
+    """
+    Token bucket por clave (IP, email, ...) en memoria del proceso.
+    Un bucket se descarta recien cuando ya estaria lleno otra vez, asi que
+    olvidarlo no regala intentos. max_keys acota la memoria: con el mapa
+    lleno una clave nueva se rechaza (falla cerrado) en lugar de desalojar
+    otra; si no, quien rote miles de emails o IPs reiniciaria el bucket de
+    la cuenta atacada.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int, max_keys: int) -> None:
+        self.rate = rate_per_minute / 60
+        self.burst = burst
+        self.max_keys = max_keys
+        self._refill_seconds = burst / self.rate if self.rate > 0 else 3600
+        # clave -> (tokens, ultimo uso). Orden por ultimo uso, que con el
+        # mismo tiempo de recarga para todos es tambien el orden de expiracion
+        self._buckets: OrderedDict[Hashable, tuple[float, float]] = OrderedDict()
+
+    def _expire(self, now: float) -> None:
+        while self._buckets:
+            _, last = next(iter(self._buckets.values()))
+            if now - last < self._refill_seconds:
+                break
+            self._buckets.popitem(last=False)
+
+    def allow(self, key: Hashable) -> bool:
+        """Consume un token de la clave. False si el bucket esta vacio o no hay lugar"""
+        now = time.monotonic()
+        self._expire(now)
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                return False
+            bucket = (self.burst, now)
+
+        tokens, last = bucket
+        tokens = min(self.burst, tokens + (now - last) * self.rate)
+
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        return allowed
+
+    def retry_after(self, key: Hashable) -> int:
+        """Segundos hasta que la clave vuelva a tener un token (o se libere lugar)"""
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if not self._buckets or self.rate <= 0:
+                return 1
+            # Mapa lleno: hasta que expire el bucket mas antiguo
+            _, oldest = next(iter(self._buckets.values()))
+            return max(1, int(self._refill_seconds - (now - oldest)) + 1)
+
+        tokens, _ = bucket
+        missing = 1 - tokens
+        if missing <= 0 or self.rate <= 0:
+            return 1
+        return max(1, int(missing / self.rate) + 1)
+
+    def reset(self) -> None:
+        self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class InFlightLimit:
+    """Cupo global de operaciones concurrentes. Sin espera: acquire falla si esta lleno"""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.in_flight = 0
+
+    def acquire(self) -> bool:
+        if self.in_flight >= self.limit:
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
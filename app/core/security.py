@@ -1,16 +1,31 @@
+import asyncio
+import hashlib
+import hmac
+import secrets
+import time
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 import jwt
 from pwdlib import PasswordHash
 from pwdlib.hashers.argon2 import Argon2Hasher
 
+from app.core.cache import TTLCache
 from app.core.config import settings
-from fastapi.security import HTTPBearer
+from fastapi.security import HTTPBearer, APIKeyHeader
 
 http_bearer = HTTPBearer(auto_error=True)
 http_bearer_optional = HTTPBearer(auto_error=False)
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+
+API_KEY_PREFIX = "bgk_"
 
 password_hash = PasswordHash((
-    Argon2Hasher(), 
+    Argon2Hasher(
+        time_cost=settings.argon2_time_cost,
+        memory_cost=settings.argon2_memory_cost,
+        parallelism=settings.argon2_parallelism
+    ),
 ))
 
 
@@ -22,8 +37,165 @@ def verify_password(plain: str, hashed: str) -> bool:
     return password_hash.verify(plain, hashed)
 
 
+def verify_and_update_password(plain: str, hashed: str) -> tuple[bool, str | None]:
+    """
+    Verifica y, si el hash guardado usa otros parametros de Argon2,
+    devuelve tambien el hash recalculado con los actuales
+    """
+    return password_hash.verify_and_update(plain, hashed)
+
+
+class PasswordHasherBusyError(Exception):
+    """Se lanza cuando la cola del executor de Argon2 esta llena"""
+    pass
+
+
+class PasswordHasherPool:
+    """
+    Executor dedicado para Argon2, separado del threadpool de anyio que
+    comparten las dependencias sincronas. La cola es acotada: con
+    workers + max_queue operaciones pendientes, las nuevas se rechazan
+    en lugar de esperar.
+    kind="thread" basta porque argon2-cffi libera el GIL mientras calcula;
+    kind="process" reparte el trabajo entre procesos.
+    """
+
+    def __init__(self, workers: int, max_queue: int, kind: str = "thread") -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown password hash executor '{kind}'")
+        self.workers = workers
+        self.max_queue = max_queue
+        self.kind = kind
+        self._executor: Executor | None = None
+
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.time_total = 0.0
+        self.time_max = 0.0
+
+    def _get_executor(self) -> Executor:
+        # Se crea al primer uso para poder apagarlo y recrearlo (tests, lifespan)
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix="argon2"
+                )
+        return self._executor
+
+    async def run(self, func, *args):
+        if self.pending >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusyError("Password hashing queue is full")
+
+        self.pending += 1
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            # Latencia completa: espera en cola mas calculo del hash
+            elapsed = time.perf_counter() - start
+            self.pending -= 1
+            self.completed += 1
+            self.time_total += elapsed
+            self.time_max = max(self.time_max, elapsed)
+
+    def stats(self) -> dict:
+        avg = self.time_total / self.completed if self.completed else 0.0
+        return {
+            "executor": self.kind,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": min(self.pending, self.workers),
+            "queued": max(self.pending - self.workers, 0),
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "latency_avg_ms": round(avg * 1000, 2),
+            "latency_max_ms": round(self.time_max * 1000, 2),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasherPool(
+    workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_max_queue,
+    kind=settings.password_hash_executor
+)
+
+
+async def hash_password_async(plain: str) -> str:
+    return await password_hasher.run(hash_password, plain)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    return await password_hasher.run(verify_password, plain, hashed)
+
+
+async def verify_and_update_password_async(plain: str, hashed: str) -> tuple[bool, str | None]:
+    return await password_hasher.run(verify_and_update_password, plain, hashed)
+
+
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(minutes=settings.jwt_expire_min)
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.jwt_secret, algorithm=settings.jwt_alg)
\ No newline at end of file
+    now = datetime.now(timezone.utc)
+    expire = now + timedelta(minutes=settings.jwt_expire_min)
+    # jti identifica el token para poder revocarlo antes de exp
+    to_encode.update({"iat": now, "exp": expire, "jti": uuid.uuid4().hex})
+    return jwt.encode(to_encode, settings.jwt_secret, algorithm=settings.jwt_alg)
+
+
+# Claims ya verificados, por digest del token. Cada entrada vive hasta el
+# exp del token: la firma HMAC se verifica una vez por token y proceso.
+_verified_tokens = TTLCache(max_size=settings.token_cache_max_size, ttl=0)
+
+
+def decode_access_token(token: str) -> dict:
+    """
+    Verifica firma y expiracion del access token y devuelve sus claims.
+    Lanza las excepciones de PyJWT (ExpiredSignatureError, InvalidTokenError).
+    El dict devuelto es compartido entre peticiones: no modificarlo.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _verified_tokens.get(key)
+    if payload is not None:
+        return payload
+
+    payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_alg])
+
+    # Sin exp no hay hasta cuando confiar: esos tokens no se cachean
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, (int, float)):
+        remaining = expires_at - time.time()
+        if remaining > 0:
+            _verified_tokens.set(key, payload, ttl=remaining)
+    return payload
+
+
+def generate_refresh_token() -> str:
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    # 256 bits aleatorios: un hash rapido basta, no hace falta Argon2
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def generate_api_key() -> str:
+    return API_KEY_PREFIX + secrets.token_urlsafe(32)
+
+
+def hash_api_key(api_key: str) -> str:
+    """
+    Digest con clave (HMAC-SHA256). Se busca por indice exacto: sin la clave
+    del servidor no se puede construir un digest que acierte por prefijo.
+    """
+    secret = settings.api_key_secret or settings.jwt_secret
+    return hmac.new(secret.encode(), api_key.encode(), hashlib.sha256).hexdigest()
@@ -1,3 +1,5 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 from app.modules.catalog.handlers import (
     category_exists_handler,
@@ -27,15 +29,66 @@ from app.modules.catalog.exceptions import (
     VariantNotEmptyError,
     ProductNotEmptyError
 )
+from app.core.config import settings
+from app.core.dependencies import CurrentAdmin
+from app.core.db import engine, replica_engine, warm_up_pool
+from app.core.pool import pool_stats
+from app.core.security import password_hasher
+from app.modules.auth.revocation import revocation_list
+from app.modules.catalog.autocomplete import autocomplete_index
+from app.core.middleware import (
+    QueryStatsMiddleware,
+    ReadYourWritesMiddleware,
+    CancelOnDisconnectMiddleware
+)
 from app.modules.auth.router import router as auth_router
 from app.modules.catalog.routers import catalog_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Arranque: conexiones listas antes del primer request
+    await warm_up_pool(engine, settings.db_warmup_connections)
+    if replica_engine is not engine:
+        await warm_up_pool(replica_engine, settings.db_warmup_connections)
+
+    # Copia en memoria de los tokens revocados: carga inicial, sync periodico
+    # y limpieza de los tokens vencidos
+    revocation_sync = asyncio.create_task(
+        revocation_list.run(settings.token_revocation_sync_seconds, settings.token_purge_seconds)
+    )
+    # Indice de autocompletado: mismo esquema de carga y sync incremental
+    autocomplete_sync = asyncio.create_task(
+        autocomplete_index.run(settings.autocomplete_sync_seconds, settings.autocomplete_rebuild_seconds)
+    )
+
+    yield
+
+    # Apagado: detiene los sync, libera el executor de Argon2 y cierra las
+    # conexiones del pool
+    for task in (revocation_sync, autocomplete_sync):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    password_hasher.shutdown()
+    if replica_engine is not engine:
+        await replica_engine.dispose()
+    await engine.dispose()
+
+
 app = FastAPI(
     title="BEGamer components", 
     version="0.1.0",
-    swagger_ui_parameters={"persistAuthorization": True}
+    swagger_ui_parameters={"persistAuthorization": True},
+    lifespan=lifespan
     )
 
+app.add_middleware(CancelOnDisconnectMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+# Sin replica todas las lecturas ya van a la primaria: la cookie no aporta
+if replica_engine is not engine:
+    app.add_middleware(ReadYourWritesMiddleware)
+
 app.add_exception_handler(CategoryNotFoundError, category_not_found_handler)
 app.add_exception_handler(CategoryAlreadyExistsError, category_exists_handler)
 app.add_exception_handler(CategoryNotEmptyError, category_not_empty_handler)
@@ -53,6 +106,23 @@ app.add_exception_handler(ProductNotEmptyError, product_not_empty_handler)
 async def health():
     return {"status": "ok"}
 
+# Las metricas internas (pool, executor de hashing, indices) solo para
+# admins: revelan, por ejemplo, cuando el login esta saturado
+@app.get("/health/db")
+async def health_db(admin: CurrentAdmin):
+    stats = pool_stats(engine.pool)
+    if replica_engine is not engine:
+        stats["replica"] = pool_stats(replica_engine.pool)
+    return stats
+
+@app.get("/health/auth")
+async def health_auth(admin: CurrentAdmin):
+    return password_hasher.stats()
+
+@app.get("/health/autocomplete")
+async def health_autocomplete(admin: CurrentAdmin):
+    return autocomplete_index.stats()
+
 #Routers por módulo
 app.include_router(auth_router, prefix="/auth", tags=["auth"])
 app.include_router(catalog_router)
\ No newline at end of file
@@ -0,0 +1,99 @@
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.modules.auth.models import User, ApiKey
+from app.modules.auth.schemas import Principal
+from app.modules.auth import repository as repo
+import uuid
+
+# Identidad de los usuarios autenticados recientes, por user_id. Cada
+# worker tiene el suyo.
+principal_cache = TTLCache(
+    max_size=settings.principal_cache_max_size,
+    ttl=settings.principal_cache_ttl_seconds
+)
+
+# API keys por digest. Solo se cachean claves existentes
+api_key_cache = TTLCache(
+    max_size=settings.principal_cache_max_size,
+    ttl=settings.principal_cache_ttl_seconds
+)
+
+
+async def get_principal(session: AsyncSession, user_id: uuid.UUID) -> Principal | None:
+    """
+    Identidad (id, rol, is_active) desde el cache o, si no esta, desde la
+    BD. Solo se guarda lo que usan los chequeos de acceso, nunca el hash
+    del password.
+    """
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    user = await repo.get_user_by_id(session, user_id)
+    if user is None:
+        return None
+
+    principal = Principal(user_id=user.user_id, role=user.role, is_active=user.is_active)
+    principal_cache.set(user_id, principal)
+    return principal
+
+
+# Las invalidaciones se anotan al hacer flush y se aplican en after_commit:
+# si se aplicaran en el flush, otra peticion podria releer la fila vieja
+# antes del commit y volver a cachearla por todo el TTL
+_PENDING_KEY = "auth_cache_invalidations"
+
+
+def _defer_invalidation(target, cache: TTLCache, key) -> None:
+    session = object_session(target)
+    if session is None:
+        cache.invalidate(key)
+        return
+    session.info.setdefault(_PENDING_KEY, []).append((cache, key))
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_principal(mapper, connection, target: User) -> None:
+    # Cualquier cambio en la fila (rol, is_active, password) descarta la copia
+    _defer_invalidation(target, principal_cache, target.user_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_invalidations(session) -> None:
+    for cache, key in session.info.pop(_PENDING_KEY, []):
+        cache.invalidate(key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_invalidations(session) -> None:
+    # La fila no cambio: la copia cacheada sigue valida
+    session.info.pop(_PENDING_KEY, None)
+
+
+async def get_api_key(session: AsyncSession, key_digest: str) -> ApiKey | None:
+    api_key = api_key_cache.get(key_digest)
+    if api_key is not None:
+        return api_key
+
+    api_key = await repo.get_api_key_by_digest(session, key_digest)
+    if api_key is not None:
+        api_key_cache.set(key_digest, ApiKey(
+            key_id=api_key.key_id,
+            name=api_key.name,
+            key_prefix=api_key.key_prefix,
+            key_digest=api_key.key_digest,
+            scopes=api_key.scopes,
+            is_active=api_key.is_active
+        ))
+    return api_key
+
+
+@event.listens_for(ApiKey, "after_update")
+@event.listens_for(ApiKey, "after_delete")
+def _invalidate_api_key(mapper, connection, target: ApiKey) -> None:
+    # Desactivar o borrar la clave la saca del cache de este worker
+    _defer_invalidation(target, api_key_cache, target.key_digest)
@@ -1,7 +1,9 @@
 from app.modules.auth.schemas import UserBase
 from app.core.AuditMixin import AuditMixin
 from enum import Enum 
-from sqlmodel import Field, AutoString
+from sqlmodel import SQLModel, Field, AutoString
+from sqlalchemy import DateTime, func
+from datetime import datetime
 import uuid
 import uuid6
 
@@ -12,4 +14,57 @@ class Role(str, Enum):
 class User(UserBase, AuditMixin, table=True):
     user_id: uuid.UUID = Field(default_factory=uuid6.uuid7, primary_key=True)
     role: Role = Field(sa_type=AutoString) #Guarda el enum como String para evitar problemas de migraciones con PostgreSQL
-    hashed_password: str
\ No newline at end of file
+    hashed_password: str
+
+
+class ApiKey(AuditMixin, table=True):
+    """
+    Credencial de una integracion (proveedores, sync de stock). Se guarda
+    el HMAC-SHA256 de la clave; key_prefix solo sirve para identificarla.
+    scopes es una lista separada por espacios, ej. "catalog:write".
+    """
+    __tablename__ = "api_key"
+
+    key_id: uuid.UUID = Field(default_factory=uuid6.uuid7, primary_key=True)
+    name: str = Field(unique=True)
+    key_prefix: str
+    key_digest: str = Field(unique=True, index=True)
+    scopes: str
+
+
+class RefreshToken(SQLModel, table=True):
+    """
+    Refresh token opaco. Solo se guarda su hash SHA-256; el token en claro
+    lo tiene unicamente el cliente. Todos los tokens nacidos de un mismo
+    login comparten family_id para poder revocar la cadena completa.
+    """
+    __tablename__ = "refresh_token"
+
+    token_id: uuid.UUID = Field(default_factory=uuid6.uuid7, primary_key=True)
+    user_id: uuid.UUID = Field(foreign_key="user.user_id", index=True)
+    family_id: uuid.UUID = Field(index=True)
+    token_hash: str = Field(unique=True, index=True)
+    expires_at: datetime = Field(sa_type=DateTime(timezone=True))
+    revoked_at: datetime | None = Field(default=None, sa_type=DateTime(timezone=True))
+    created_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()}
+    )
+
+
+class RevokedToken(SQLModel, table=True):
+    """
+    Access token revocado antes de su exp. Cada worker mantiene una copia
+    en memoria (app/modules/auth/revocation.py); la fila sobra pasado expires_at.
+    """
+    __tablename__ = "revoked_token"
+
+    jti: str = Field(primary_key=True)
+    expires_at: datetime = Field(sa_type=DateTime(timezone=True), index=True)
+    revoked_at: datetime | None = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+        index=True,
+        sa_column_kwargs={"server_default": func.now()}
+    )
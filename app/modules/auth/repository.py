@@ -1,6 +1,8 @@
 from sqlmodel import select
+from sqlalchemy import delete, update
 from sqlmodel.ext.asyncio.session import AsyncSession
-from app.modules.auth.models import User
+from app.modules.auth.models import User, RefreshToken, ApiKey
+from datetime import datetime
 import uuid
 
 
@@ -17,4 +19,63 @@ async def get_user_by_id(
     query = select(User).where(User.user_id == user_id)
     result = await session.exec(query)
 
-    return result.first()
\ No newline at end of file
+    return result.first()
+
+
+async def add_refresh_token(
+    session: AsyncSession,
+    token: RefreshToken
+) -> RefreshToken:
+    session.add(token)
+    await session.flush()
+    return token
+
+async def get_refresh_token_by_hash(
+    session: AsyncSession,
+    token_hash: str
+    ) -> RefreshToken | None:
+    # FOR UPDATE: dos refresh simultaneos con el mismo token se serializan
+    query = (
+        select(RefreshToken)
+        .where(RefreshToken.token_hash == token_hash)
+        .with_for_update()
+    )
+    result = await session.exec(query)
+
+    return result.first()
+
+async def revoke_refresh_family(
+    session: AsyncSession,
+    family_id: uuid.UUID,
+    revoked_at: datetime
+    ) -> None:
+    statement = (
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id)
+        .where(RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=revoked_at)
+    )
+    await session.execute(statement)
+
+
+async def delete_expired_refresh_tokens(session: AsyncSession, now: datetime) -> int:
+    statement = delete(RefreshToken).where(RefreshToken.expires_at <= now)
+    result = await session.execute(statement)
+    return result.rowcount
+
+async def get_api_key_by_digest(
+    session: AsyncSession,
+    key_digest: str
+    ) -> ApiKey | None:
+    query = select(ApiKey).where(ApiKey.key_digest == key_digest)
+    result = await session.exec(query)
+
+    return result.first()
+
+async def add_api_key(
+    session: AsyncSession,
+    api_key: ApiKey
+) -> ApiKey:
+    session.add(api_key)
+    await session.flush()
+    return api_key
@@ -0,0 +1,95 @@
+# Lista de access tokens revocados antes de su exp. La fuente de verdad es
+# la tabla revoked_token; cada worker guarda una copia en memoria (jti -> exp)
+# que se actualiza de forma incremental en segundo plano, asi el chequeo en
+# cada peticion no toca la BD.
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.db import AsyncSessionLocal, PrimaryReadSessionLocal
+from app.modules.auth import repository as repo
+from app.modules.auth.models import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+# Margen hacia atras en cada sync: una revocacion confirmada tarde puede
+# tener revoked_at anterior al ultimo sync
+SYNC_OVERLAP = timedelta(seconds=60)
+
+
+class RevocationList:
+
+    def __init__(self) -> None:
+        self._revoked: dict[str, float] = {}
+        self._synced_until: datetime | None = None
+        self._purged_at: float | None = None
+
+    def is_revoked(self, jti: str | None) -> bool:
+        return jti is not None and jti in self._revoked
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        self._revoked[jti] = expires_at.timestamp()
+
+    async def sync(self, session: AsyncSession) -> None:
+        """Trae las revocaciones nuevas desde el ultimo sync y descarta las vencidas"""
+        now = datetime.now(timezone.utc)
+        query = select(RevokedToken.jti, RevokedToken.expires_at).where(RevokedToken.expires_at > now)
+        if self._synced_until is not None:
+            query = query.where(RevokedToken.revoked_at > self._synced_until - SYNC_OVERLAP)
+
+        result = await session.exec(query)
+        for jti, expires_at in result.all():
+            self.add(jti, expires_at)
+
+        self._synced_until = now
+        self._prune()
+
+    def _prune(self) -> None:
+        now = time.time()
+        expired = [jti for jti, expires_at in self._revoked.items() if expires_at <= now]
+        for jti in expired:
+            del self._revoked[jti]
+
+    async def run(self, interval: float, purge_interval: float) -> None:
+        """Sync periodico y limpieza de tokens vencidos; corre como tarea del lifespan"""
+        while True:
+            try:
+                async with PrimaryReadSessionLocal() as session:
+                    await self.sync(session)
+                if self._purged_at is None or time.monotonic() - self._purged_at >= purge_interval:
+                    # La sesion del sync es de solo lectura: el borrado va aparte
+                    async with AsyncSessionLocal.begin() as session:
+                        await purge_expired_tokens(session, datetime.now(timezone.utc))
+                    self._purged_at = time.monotonic()
+            except Exception as e:
+                # Sin BD se sigue con la ultima copia; se reintenta en el proximo ciclo
+                logger.warning(f"Token revocation sync failed: {e}")
+            await asyncio.sleep(interval)
+
+    def clear(self) -> None:
+        self._revoked.clear()
+        self._synced_until = None
+        self._purged_at = None
+
+    def __len__(self) -> int:
+        return len(self._revoked)
+
+
+revocation_list = RevocationList()
+
+
+async def revoke_token(session: AsyncSession, jti: str, expires_at: datetime) -> None:
+    """Revoca un access token: lo guarda en la BD y en la copia de este worker"""
+    await session.merge(RevokedToken(jti=jti, expires_at=expires_at))
+    revocation_list.add(jti, expires_at)
+
+
+async def purge_expired_tokens(session: AsyncSession, now: datetime) -> None:
+    """Borra los refresh tokens y las revocaciones que ya pasaron su expires_at"""
+    refresh_tokens = await repo.delete_expired_refresh_tokens(session, now)
+    result = await session.execute(delete(RevokedToken).where(RevokedToken.expires_at <= now))
+    if refresh_tokens or result.rowcount:
+        logger.info(f"Purged {refresh_tokens} refresh tokens and {result.rowcount} revoked tokens")
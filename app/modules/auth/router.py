@@ -1,9 +1,17 @@
-from fastapi import APIRouter
-from app.modules.auth.schemas import TokenOut, LoginRequest
-from app.core.dependencies import SessionDep #Dependencia de sesion asincrona
-from app.modules.auth.service import login_user
-
-router = APIRouter()
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.security import HTTPAuthorizationCredentials
+from app.core.security import http_bearer_optional
+from app.modules.auth.schemas import TokenOut, LoginRequest, RefreshRequest
+from app.core.dependencies import SessionDep, AuthProfile #Dependencia de sesion asincrona
+from app.modules.auth.service import (
+    login_user,
+    refresh_tokens,
+    revoke_refresh_token,
+    revoke_access_token
+)
+from app.modules.auth.throttle import login_admission
+
+router = APIRouter(dependencies=[AuthProfile])
 
 
 @router.post(
@@ -11,11 +19,30 @@ router = APIRouter()
     response_model=TokenOut, 
     summary="Inicia sesion con email y contraseña"
     )
-async def login(session: SessionDep, body: LoginRequest):
-    token = await login_user(session, body.email, body.password)
-    return {"access_token": token, "token_type": "bearer"}
-
+async def login(request: Request, session: SessionDep, body: LoginRequest):
+    async with login_admission(request, body.email):
+        return await login_user(session, body.email, body.password)
 
 
+@router.post(
+    "/refresh",
+    response_model=TokenOut,
+    summary="Renueva el access token con un refresh token (rotacion)"
+    )
+async def refresh(session: SessionDep, body: RefreshRequest):
+    return await refresh_tokens(session, body.refresh_token)
 
 
+@router.post(
+    "/logout",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Revoca el refresh token, su familia y el access token enviado"
+    )
+async def logout(
+    session: SessionDep,
+    body: RefreshRequest,
+    token_auth: HTTPAuthorizationCredentials | None = Depends(http_bearer_optional)
+):
+    await revoke_refresh_token(session, body.refresh_token)
+    if token_auth:
+        await revoke_access_token(session, token_auth.credentials)
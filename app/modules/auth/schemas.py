@@ -1,5 +1,6 @@
 from sqlmodel import SQLModel, Field
 from pydantic import SecretStr, EmailStr, BaseModel
+import uuid
 
 
 
@@ -13,3 +14,13 @@ class LoginRequest(BaseModel):
 class TokenOut(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: str
+
+class RefreshRequest(BaseModel):
+    refresh_token: SecretStr
+
+class Principal(BaseModel):
+    """Identidad tomada de los claims firmados del token, sin ir a la BD"""
+    user_id: uuid.UUID
+    role: str
+    is_active: bool
@@ -1,25 +1,149 @@
 from app.modules.auth import repository as repo
+from app.modules.auth.models import User, RefreshToken
 from fastapi import HTTPException, status
-from app.core.security import verify_password, create_access_token
+from app.core.config import settings
+from app.core.security import (
+    verify_and_update_password_async,
+    create_access_token,
+    generate_refresh_token,
+    hash_refresh_token,
+    decode_access_token,
+    PasswordHasherBusyError
+)
+from app.modules.auth.revocation import revoke_token
+from datetime import datetime, timedelta, timezone
 from pydantic import EmailStr, SecretStr
 from sqlmodel.ext.asyncio.session import AsyncSession
-from fastapi.concurrency import run_in_threadpool
+import jwt
+import uuid
+import uuid6
 
 
 
-async def login_user(session: AsyncSession, email: EmailStr, password: SecretStr) -> str:
+async def login_user(session: AsyncSession, email: EmailStr, password: SecretStr) -> dict:
     user = await repo.get_user_by_email(session, email)
-    #cambiar verify password a RUN IN THREADPOOL
-    if not user or not await run_in_threadpool(
-        verify_password, 
-        password.get_secret_value(), 
-        user.hashed_password
-        ):
-        
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials"
             )
-    return create_access_token(data={"sub": str(user.user_id), "role": user.role})
 
-    
+    # Argon2 corre en su propio executor acotado; si esta saturado se
+    # responde 503 de inmediato en vez de encolar el login
+    try:
+        valid, new_hash = await verify_and_update_password_async(
+            password.get_secret_value(),
+            user.hashed_password
+        )
+    except PasswordHasherBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication service busy, retry later",
+            headers={"Retry-After": "1"}
+        )
+
+    if not valid:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid credentials"
+            )
+
+    # Hash con parametros de Argon2 viejos: se reemplaza ahora que tenemos
+    # la contraseña en claro, sin obligar a un reseteo
+    if new_hash is not None:
+        user.hashed_password = new_hash
+        session.add(user)
+
+    # Cada login abre una familia nueva de refresh tokens
+    return await _issue_tokens(session, user, uuid6.uuid7())
+
+
+async def refresh_tokens(session: AsyncSession, refresh_token: SecretStr) -> dict:
+    """
+    Cambia un refresh token por un access token nuevo sin verificar la
+    contraseña. El refresh token usado se revoca y se entrega otro de la
+    misma familia (rotacion). Reusar un token ya rotado revoca la familia.
+    """
+    now = datetime.now(timezone.utc)
+    stored = await repo.get_refresh_token_by_hash(
+        session,
+        hash_refresh_token(refresh_token.get_secret_value())
+    )
+
+    if not stored or stored.expires_at <= now:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token"
+            )
+
+    if stored.revoked_at is not None:
+        # Token robado o cliente con estado viejo: se corta toda la cadena.
+        # Se confirma antes del 401, porque get_db hace rollback ante el error
+        await repo.revoke_refresh_family(session, stored.family_id, now)
+        await session.commit()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token"
+            )
+
+    user = await repo.get_user_by_id(session, stored.user_id)
+    if not user or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token"
+            )
+
+    stored.revoked_at = now
+    session.add(stored)
+    return await _issue_tokens(session, user, stored.family_id)
+
+
+async def revoke_refresh_token(session: AsyncSession, refresh_token: SecretStr) -> None:
+    """Cierra la sesion: revoca la familia completa del refresh token"""
+    stored = await repo.get_refresh_token_by_hash(
+        session,
+        hash_refresh_token(refresh_token.get_secret_value())
+    )
+    if stored:
+        await repo.revoke_refresh_family(
+            session,
+            stored.family_id,
+            datetime.now(timezone.utc)
+        )
+
+
+async def revoke_access_token(session: AsyncSession, access_token: str) -> None:
+    """Revoca el access token antes de su exp. Un token invalido no se registra"""
+    try:
+        payload = decode_access_token(access_token)
+    except jwt.InvalidTokenError:
+        return
+
+    if "jti" in payload and "exp" in payload:
+        await revoke_token(
+            session,
+            payload["jti"],
+            datetime.fromtimestamp(payload["exp"], timezone.utc)
+        )
+
+
+async def _issue_tokens(session: AsyncSession, user: User, family_id: uuid.UUID) -> dict:
+    refresh_token = generate_refresh_token()
+    await repo.add_refresh_token(
+        session,
+        RefreshToken(
+            user_id=user.user_id,
+            family_id=family_id,
+            token_hash=hash_refresh_token(refresh_token),
+            expires_at=datetime.now(timezone.utc) + timedelta(days=settings.refresh_token_expire_days)
+        )
+    )
+
+    access_token = create_access_token(
+        data={"sub": str(user.user_id), "role": user.role, "is_active": user.is_active}
+    )
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "refresh_token": refresh_token
+    }
@@ -0,0 +1,66 @@
+# Control de admision para POST /auth/login. Cada intento cuesta una
+# verificacion Argon2 completa, asi que los rechazos se deciden aqui,
+# antes de tocar la BD o el executor de hashing.
+from contextlib import asynccontextmanager
+from fastapi import HTTPException, Request, status
+from app.core.config import settings
+from app.core.rate_limit import TokenBucketLimiter, InFlightLimit
+
+ip_limiter = TokenBucketLimiter(
+    rate_per_minute=settings.login_ip_rate_per_min,
+    burst=settings.login_ip_burst,
+    max_keys=settings.login_throttle_max_keys
+)
+
+email_limiter = TokenBucketLimiter(
+    rate_per_minute=settings.login_email_rate_per_min,
+    burst=settings.login_email_burst,
+    max_keys=settings.login_throttle_max_keys
+)
+
+in_flight = InFlightLimit(settings.login_max_in_flight)
+
+
+def _client_ip(request: Request) -> str:
+    # Detras de un proxy, uvicorn --proxy-headers deja aqui la IP real
+    return request.client.host if request.client else "unknown"
+
+
+def _too_many_attempts(retry_after: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many login attempts",
+        headers={"Retry-After": str(retry_after)}
+    )
+
+
+@asynccontextmanager
+async def login_admission(request: Request, email: str):
+    """
+    Deja pasar el intento de login o lo rechaza sin hashear:
+    429 si la IP o el email agotaron su bucket, 503 si ya hay
+    demasiados logins en curso en este worker.
+    """
+    ip = _client_ip(request)
+    if not ip_limiter.allow(ip):
+        raise _too_many_attempts(ip_limiter.retry_after(ip))
+
+    email_key = email.lower()
+    if not email_limiter.allow(email_key):
+        raise _too_many_attempts(email_limiter.retry_after(email_key))
+
+    if not in_flight.acquire():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication service busy, retry later",
+            headers={"Retry-After": "1"}
+        )
+    try:
+        yield
+    finally:
+        in_flight.release()
+
+
+def reset() -> None:
+    ip_limiter.reset()
+    email_limiter.reset()
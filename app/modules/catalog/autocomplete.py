@@ -0,0 +1,213 @@
+# Indice de prefijos en memoria para el autocompletado (search-as-you-type).
+# Cada worker guarda un arreglo ordenado de claves normalizadas (minusculas,
+# sin tildes) y responde con bisect, sin tocar la BD. Cada termino se indexa
+# desde el inicio de cada palabra: "rtx" encuentra "Gaming GeForce RTX 4070".
+# Se mantiene como la lista de revocaciones: carga completa al arrancar,
+# sync incremental por updated_at y una reconstruccion periodica que
+# descarta las filas borradas. Un termino solo se indexa si su fila y todos
+# sus padres (producto, marca, categoria) estan activos.
+import asyncio
+import logging
+import time
+import unicodedata
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+from sqlalchemy import and_, or_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from app.core.db import PrimaryReadSessionLocal
+from app.modules.catalog.models import Brand, Category, Product, ProductVariant
+
+logger = logging.getLogger(__name__)
+
+# Margen hacia atras en cada sync: updated_at es la hora de inicio de la
+# transaccion, que puede confirmarse despues del ultimo sync
+SYNC_OVERLAP = timedelta(seconds=60)
+
+_PRODUCT_PARENTS = [
+    (Brand, Product.brand_id == Brand.brand_id),
+    (Category, Product.category_id == Category.category_id),
+]
+
+# (tipo, modelo, columna de id, columna del termino, padres con su join)
+SOURCES = [
+    ("product", Product, Product.product_id, Product.name, _PRODUCT_PARENTS),
+    ("brand", Brand, Brand.brand_id, Brand.name, []),
+    ("category", Category, Category.category_id, Category.name, []),
+    (
+        "sku", ProductVariant, ProductVariant.variant_id, ProductVariant.sku,
+        [(Product, ProductVariant.product_id == Product.product_id), *_PRODUCT_PARENTS]
+    ),
+]
+
+Ref = tuple[str, object]  # (tipo, id de la fila)
+
+
+def normalize(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    folded = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(folded.replace("-", " ").split())
+
+
+def _word_suffixes(term: str) -> list[str]:
+    # "gaming geforce rtx" -> ["gaming geforce rtx", "geforce rtx", "rtx"]
+    words = normalize(term).split(" ")
+    return [" ".join(words[i:]) for i in range(len(words)) if words[i]]
+
+
+def _build(rows: Iterable[tuple[str, object, str]]) -> tuple[list[str], list[Ref], dict[Ref, str]]:
+    entries = []
+    terms = {}
+    for kind, row_id, term in rows:
+        ref = (kind, row_id)
+        terms[ref] = term
+        entries.extend((key, ref) for key in _word_suffixes(term))
+    entries.sort(key=lambda entry: entry[0])
+    return [key for key, _ in entries], [ref for _, ref in entries], terms
+
+
+def _source_query(model, id_column, term_column, parents):
+    """SELECT (id, termino, activo) de una fuente; activo exige a todos los padres"""
+    models = [model, *(parent for parent, _ in parents)]
+    active = and_(*(m.is_active.is_(True) for m in models)).label("active")
+    query = select(id_column, term_column, active).select_from(model)
+    for parent, onclause in parents:
+        query = query.join(parent, onclause)
+    return query, models, active
+
+
+class PrefixIndex:
+
+    def __init__(self) -> None:
+        # _keys ordenado; _refs[i] es la fila de _keys[i]
+        self._keys: list[str] = []
+        self._refs: list[Ref] = []
+        self._terms: dict[Ref, str] = {}
+        self._synced_until: datetime | None = None
+        self._built_at: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._built_at is not None
+
+    def search(self, prefix: str, limit: int) -> list[dict]:
+        """Terminos cuyo inicio o el de alguna de sus palabras empieza por prefix"""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+
+        results = []
+        seen = set()
+        i = bisect_left(self._keys, prefix)
+        while i < len(self._keys) and len(results) < limit and self._keys[i].startswith(prefix):
+            ref = self._refs[i]
+            if ref not in seen:
+                seen.add(ref)
+                results.append({"term": self._terms[ref], "kind": ref[0]})
+            i += 1
+        return results
+
+    def upsert(self, kind: str, row_id, term: str, active: bool = True) -> None:
+        ref = (kind, row_id)
+        if self._terms.get(ref) == term and active:
+            return
+        self.remove(kind, row_id)
+        if not active:
+            return
+
+        self._terms[ref] = term
+        for key in _word_suffixes(term):
+            i = bisect_left(self._keys, key)
+            self._keys.insert(i, key)
+            self._refs.insert(i, ref)
+
+    def remove(self, kind: str, row_id) -> None:
+        ref = (kind, row_id)
+        term = self._terms.pop(ref, None)
+        if term is None:
+            return
+
+        for key in _word_suffixes(term):
+            i = bisect_left(self._keys, key)
+            while i < len(self._keys) and self._keys[i] == key:
+                if self._refs[i] == ref:
+                    del self._keys[i]
+                    del self._refs[i]
+                    break
+                i += 1
+
+    def replace_all(self, rows: Iterable[tuple[str, object, str]]) -> None:
+        """Reconstruye el indice con (tipo, id, termino) de las filas activas"""
+        self._swap(*_build(rows))
+
+    def _swap(self, keys: list[str], refs: list[Ref], terms: dict[Ref, str]) -> None:
+        self._keys = keys
+        self._refs = refs
+        self._terms = terms
+        self._built_at = time.monotonic()
+
+    async def rebuild(self, session: AsyncSession) -> None:
+        now = datetime.now(timezone.utc)
+        rows = []
+        for kind, *source in SOURCES:
+            query, _, active = _source_query(*source)
+            result = await session.exec(query.where(active))
+            rows.extend((kind, row_id, term) for row_id, term, _ in result.all())
+
+        # Con cientos de miles de terminos armar y ordenar lleva mas de un
+        # segundo: fuera del event loop, y se reemplaza de una sola vez
+        self._swap(*await asyncio.to_thread(_build, rows))
+        self._synced_until = now
+        logger.info(f"Autocomplete index built: {len(self._terms)} terms")
+
+    async def sync(self, session: AsyncSession) -> None:
+        """Aplica las filas creadas o modificadas desde el ultimo sync"""
+        if self._synced_until is None:
+            await self.rebuild(session)
+            return
+
+        now = datetime.now(timezone.utc)
+        since = self._synced_until - SYNC_OVERLAP
+        for kind, *source in SOURCES:
+            # Desactivar o reactivar un padre tambien cambia a sus hijos
+            query, models, _ = _source_query(*source)
+            result = await session.exec(query.where(or_(*(m.updated_at > since for m in models))))
+            for row_id, term, is_active in result.all():
+                self.upsert(kind, row_id, term, is_active)
+        self._synced_until = now
+
+    async def run(self, interval: float, rebuild_interval: float) -> None:
+        """Sync periodico; corre como tarea del lifespan"""
+        while True:
+            try:
+                async with PrimaryReadSessionLocal() as session:
+                    # Los borrados no dejan updated_at: se reconstruye cada tanto
+                    if self._built_at is None or time.monotonic() - self._built_at >= rebuild_interval:
+                        await self.rebuild(session)
+                    else:
+                        await self.sync(session)
+            except Exception as e:
+                # Sin BD se sigue con la ultima copia; se reintenta en el proximo ciclo
+                logger.warning(f"Autocomplete index sync failed: {e}")
+            await asyncio.sleep(interval)
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "terms": len(self._terms),
+            "keys": len(self._keys),
+        }
+
+    def clear(self) -> None:
+        self._keys = []
+        self._refs = []
+        self._terms = {}
+        self._synced_until = None
+        self._built_at = None
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+
+autocomplete_index = PrefixIndex()
@@ -1,7 +1,8 @@
 from sqlmodel import Field, Relationship
 from app.core.AuditMixin import AuditMixin
 from app.modules.catalog.schemas import CategoryBase, BrandBase, ProductBase, ProductVariantBase
-from sqlalchemy import Column, Numeric
+from sqlalchemy import Column, Index, Numeric
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from decimal import Decimal
 import uuid
 import uuid6
@@ -16,6 +17,10 @@ class Category(CategoryBase, AuditMixin, table=True):
 
 class Brand(BrandBase, AuditMixin, table=True):
     __tablename__ = "brand"
+    # Trigramas para la busqueda tolerante a errores (pg_trgm)
+    __table_args__ = (
+        Index("ix_brand_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
     name: str = Field(unique=True, index=True)
     code: str = Field(unique=True, index=True)
     brand_id: uuid.UUID = Field(default_factory=uuid6.uuid7, primary_key=True)
@@ -23,6 +28,11 @@ class Brand(BrandBase, AuditMixin, table=True):
 
 class Product(ProductBase, AuditMixin, table=True):
     __tablename__ = "product"
+    __table_args__ = (
+        # Orden de los listados y clave de la paginacion keyset
+        Index("ix_product_created_at_product_id", "created_at", "product_id"),
+        Index("ix_product_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
     product_id: uuid.UUID = Field(default_factory=uuid6.uuid7, primary_key=True)
     name: str = Field(unique=True, index=True)
     slug: str = Field(unique=True, index=True)
@@ -32,8 +42,18 @@ class Product(ProductBase, AuditMixin, table=True):
     brand: "Brand" = Relationship(back_populates="products")
     variants: list["ProductVariant"] = Relationship(back_populates="product", passive_deletes=True)
 
+# Vector de busqueda full-text (ver app/modules/catalog/search.py). Lo
+# mantiene un trigger de Postgres; se agrega a la tabla despues de mapear
+# Product para que el ORM no lo cargue en cada SELECT.
+Product.__table__.append_column(Column("search_vector", TSVECTOR))
+Index("ix_product_search_vector", Product.__table__.c.search_vector, postgresql_using="gin")
+
 class ProductVariant(ProductVariantBase, AuditMixin, table=True):
     __tablename__ = "product_variant"
+    __table_args__ = (
+        Index("ix_product_variant_product_id_created_at", "product_id", "created_at", "variant_id"),
+        Index("ix_product_variant_sku_trgm", "sku", postgresql_using="gin", postgresql_ops={"sku": "gin_trgm_ops"}),
+    )
     variant_id: uuid.UUID = Field(default_factory=uuid6.uuid7, primary_key=True)
     product_id: uuid.UUID = Field(foreign_key="product.product_id")
     sku: str = Field(unique=True, index=True)
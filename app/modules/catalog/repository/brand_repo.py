@@ -2,6 +2,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
 from sqlalchemy.exc import IntegrityError
 import uuid
+from app.core.counting import CountMode, count_rows
 from app.modules.catalog.models import Brand
 from app.modules.catalog.exceptions import (
     BrandAlreadyExistsError,
@@ -48,22 +49,39 @@ async def get_brand(
         raise BrandNotFoundError("Brand not found")
     return brand
 
+def _filtered_brands(is_active: bool | None = True):
+    query = select(Brand)
+
+    if is_active is not None:
+        query = query.where(Brand.is_active == is_active)
+    return query
+
 async def get_all_brands(
     session: AsyncSession,
     offset: int,
     limit: int,
     is_active: bool | None = True
 ) -> list[Brand]:
-    query = select(Brand)
-    
-    if is_active is not None:
-        query = query.where(Brand.is_active == is_active)
-        
+    query = _filtered_brands(is_active)
+
     query = query.order_by(Brand.created_at.desc())
     query = query.offset(offset).limit(limit)
     result = await session.exec(query)
     return list(result.all())
 
+async def count_brands(
+    session: AsyncSession,
+    mode: CountMode,
+    is_active: bool | None = True
+) -> tuple[int, CountMode]:
+    return await count_rows(
+        session,
+        _filtered_brands(is_active),
+        mode,
+        Brand.__tablename__,
+        (is_active,)
+    )
+
 async def update_brand(
     session: AsyncSession,
     brand_id: uuid.UUID,
@@ -2,6 +2,7 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
 from sqlalchemy.exc import IntegrityError
 import uuid
+from app.core.counting import CountMode, count_rows
 from app.modules.catalog.models import Category
 from app.modules.catalog.exceptions import (
     CategoryAlreadyExistsError, 
@@ -48,22 +49,39 @@ async def get_category(
         raise CategoryNotFoundError("Category not found")
     return category
 
+def _filtered_categories(is_active: bool | None = True):
+    query = select(Category)
+
+    if is_active is not None:
+        query = query.where(Category.is_active == is_active)
+    return query
+
 async def get_all_categories(
     session: AsyncSession,
     offset: int,
     limit: int,
     is_active: bool | None = True
 ) -> list[Category]:
-    query = select(Category)
-    
-    if is_active is not None:
-        query = query.where(Category.is_active == is_active)
-    
+    query = _filtered_categories(is_active)
+
     query = query.order_by(Category.created_at.desc())
     query = query.offset(offset).limit(limit)
     result = await session.exec(query)
     return list(result.all())
 
+async def count_categories(
+    session: AsyncSession,
+    mode: CountMode,
+    is_active: bool | None = True
+) -> tuple[int, CountMode]:
+    return await count_rows(
+        session,
+        _filtered_categories(is_active),
+        mode,
+        Category.__tablename__,
+        (is_active,)
+    )
+
 async def update_category(
     session: AsyncSession,
     category_id: uuid.UUID,
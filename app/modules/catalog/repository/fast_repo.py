@@ -0,0 +1,207 @@
+# Camino rapido para las lecturas mas frecuentes del catalogo.
+# Ejecuta prepared statements con nombre directamente sobre la conexion
+# asyncpg y mapea las filas a registros livianos con __slots__, evitando
+# la construccion del SELECT de SQLModel y la hidratacion del ORM.
+# Se activa con CATALOG_FAST_PATH=true y no se usa detras de PgBouncer
+# (los prepared statements con nombre no sobreviven al modo transaccion).
+from sqlmodel.ext.asyncio.session import AsyncSession
+from datetime import datetime
+import uuid
+from app.core.config import settings
+from app.modules.catalog.exceptions import ProductNotFoundError, VariantNotFoundError
+
+
+def enabled() -> bool:
+    return settings.catalog_fast_path and not settings.db_pgbouncer_mode
+
+
+class CategoryRecord:
+    __slots__ = ("category_id", "name", "code", "is_active", "created_at", "updated_at")
+
+    def __init__(self, category_id, name, code, is_active, created_at, updated_at):
+        self.category_id = category_id
+        self.name = name
+        self.code = code
+        self.is_active = is_active
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+class BrandRecord:
+    __slots__ = ("brand_id", "name", "code", "is_active", "created_at", "updated_at")
+
+    def __init__(self, brand_id, name, code, is_active, created_at, updated_at):
+        self.brand_id = brand_id
+        self.name = name
+        self.code = code
+        self.is_active = is_active
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+class ProductRecord:
+    __slots__ = (
+        "product_id", "name", "slug", "description", "category_id", "brand_id",
+        "is_active", "created_at", "updated_at", "category", "brand"
+    )
+
+    def __init__(self, row):
+        self.product_id = row[0]
+        self.name = row[1]
+        self.slug = row[2]
+        self.description = row[3]
+        self.category_id = row[4]
+        self.brand_id = row[5]
+        self.is_active = row[6]
+        self.created_at = row[7]
+        self.updated_at = row[8]
+        self.category = CategoryRecord(row[4], *row[9:14])
+        self.brand = BrandRecord(row[5], *row[14:19])
+
+
+class ProductBasicRecord:
+    __slots__ = ("product_id", "name", "slug", "category", "brand")
+
+    def __init__(self, product_id, name, slug, category, brand):
+        self.product_id = product_id
+        self.name = name
+        self.slug = slug
+        self.category = category
+        self.brand = brand
+
+
+class CodeNameRecord:
+    __slots__ = ("name", "code")
+
+    def __init__(self, name, code):
+        self.name = name
+        self.code = code
+
+
+class VariantRecord:
+    __slots__ = (
+        "variant_id", "product_id", "sku", "price", "stock", "attributes",
+        "is_active", "created_at", "updated_at", "product"
+    )
+
+    def __init__(self, row):
+        self.variant_id = row[0]
+        self.product_id = row[1]
+        self.sku = row[2]
+        self.price = row[3]
+        self.stock = row[4]
+        self.attributes = row[5]
+        self.is_active = row[6]
+        self.created_at = row[7]
+        self.updated_at = row[8]
+        self.product = ProductBasicRecord(
+            row[1], row[9], row[10],
+            CodeNameRecord(row[11], row[12]),
+            CodeNameRecord(row[13], row[14])
+        )
+
+
+_PRODUCT_COLUMNS = """
+    p.product_id, p.name, p.slug, p.description, p.category_id, p.brand_id,
+    p.is_active, p.created_at, p.updated_at,
+    c.name, c.code, c.is_active, c.created_at, c.updated_at,
+    b.name, b.code, b.is_active, b.created_at, b.updated_at
+    FROM product p
+    JOIN category c ON c.category_id = p.category_id
+    JOIN brand b ON b.brand_id = p.brand_id
+"""
+
+_STATEMENTS = {
+    "fast_get_product": f"""
+        SELECT {_PRODUCT_COLUMNS}
+        WHERE p.product_id = $1 AND (NOT $2::boolean OR p.is_active)
+    """,
+    "fast_list_products": f"""
+        SELECT {_PRODUCT_COLUMNS}
+        WHERE $1::boolean IS NULL OR p.is_active = $1::boolean
+        ORDER BY p.created_at DESC, p.product_id DESC
+        OFFSET $2 LIMIT $3
+    """,
+    "fast_list_products_after": f"""
+        SELECT {_PRODUCT_COLUMNS}
+        WHERE ($1::boolean IS NULL OR p.is_active = $1::boolean)
+          AND (p.created_at, p.product_id) < ($2, $3)
+        ORDER BY p.created_at DESC, p.product_id DESC
+        LIMIT $4
+    """,
+    "fast_get_variant": """
+        SELECT
+            v.variant_id, v.product_id, v.sku, v.price, v.stock, v.attributes,
+            v.is_active, v.created_at, v.updated_at,
+            p.name, p.slug, c.name, c.code, b.name, b.code
+        FROM product_variant v
+        JOIN product p ON p.product_id = v.product_id
+        JOIN category c ON c.category_id = p.category_id
+        JOIN brand b ON b.brand_id = p.brand_id
+        WHERE v.variant_id = $1 AND (NOT $2::boolean OR v.is_active)
+    """,
+}
+
+
+async def _prepared(session: AsyncSession, name: str):
+    """
+    Devuelve el prepared statement con nombre de la conexion actual,
+    preparandolo la primera vez que esa conexion lo usa.
+    """
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+
+    # El statement debe correr dentro de la transaccion de la sesion (READ
+    # ONLY, SET LOCAL, etc.). El BEGIN del adaptador es perezoso; en las rutas
+    # del catalogo ya lo disparo el set_config de after_begin. Si no, se
+    # dispara con una consulta por la API publica de SQLAlchemy
+    if not raw.driver_connection.is_in_transaction():
+        await conn.exec_driver_sql("SELECT 1")
+
+    # info vive lo mismo que la conexion fisica, igual que el statement
+    statements = raw.info.setdefault("fast_path_statements", {})
+    statement = statements.get(name)
+    if statement is None:
+        statement = await raw.driver_connection.prepare(_STATEMENTS[name], name=name)
+        statements[name] = statement
+    return statement
+
+
+async def get_product(
+    session: AsyncSession,
+    product_id: uuid.UUID,
+    only_active: bool
+) -> ProductRecord:
+    statement = await _prepared(session, "fast_get_product")
+    row = await statement.fetchrow(product_id, only_active)
+    if not row:
+        raise ProductNotFoundError("Product not found")
+    return ProductRecord(row)
+
+
+async def get_all_products(
+    session: AsyncSession,
+    offset: int,
+    limit: int,
+    is_active: bool | None = None,
+    after: tuple[datetime, uuid.UUID] | None = None
+) -> list[ProductRecord]:
+    if after is not None:
+        statement = await _prepared(session, "fast_list_products_after")
+        rows = await statement.fetch(is_active, after[0], after[1], limit)
+    else:
+        statement = await _prepared(session, "fast_list_products")
+        rows = await statement.fetch(is_active, offset, limit)
+    return [ProductRecord(row) for row in rows]
+
+
+async def get_variant_by_id(
+    session: AsyncSession,
+    variant_id: uuid.UUID,
+    only_active: bool
+) -> VariantRecord:
+    statement = await _prepared(session, "fast_get_variant")
+    row = await statement.fetchrow(variant_id, only_active)
+    if not row:
+        raise VariantNotFoundError(f"Variant with ID '{variant_id}' not found.")
+    return VariantRecord(row)
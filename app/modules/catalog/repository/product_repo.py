@@ -1,9 +1,13 @@
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlmodel import select, or_
+from sqlmodel import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func, literal_column, tuple_, union, union_all
 from sqlalchemy.orm import joinedload
+from datetime import datetime
+from app.core.counting import CountMode, count_rows
 import uuid
-from app.modules.catalog.models import Product
+from app.modules.catalog.models import Brand, Product, ProductVariant
+from app.modules.catalog.search import fuzzy_condition, fuzzy_score, search_condition, search_rank
 from app.modules.catalog.exceptions import (
     ProductAlreadyExistsError,
     ProductNotFoundError,
@@ -59,6 +63,28 @@ async def get_product(
         raise ProductNotFoundError("Product not found")
     return product
 
+def _filtered_products(
+    category_id: uuid.UUID | None = None,
+    brand_id: uuid.UUID | None = None,
+    search: str | None = None,
+    is_active: bool | None = None
+):
+    """SELECT con los filtros del listado; lo comparten la pagina y el total"""
+    query = select(Product)
+
+    if is_active is not None:
+        query = query.where(Product.is_active == is_active)
+
+    if category_id:
+        query = query.where(Product.category_id == category_id)
+
+    if brand_id:
+        query = query.where(Product.brand_id == brand_id)
+
+    if search:
+        query = query.where(search_condition(search))
+    return query
+
 async def get_all_products(
     session: AsyncSession,
     offset: int,
@@ -66,39 +92,126 @@ async def get_all_products(
     category_id: uuid.UUID | None = None,
     brand_id: uuid.UUID | None = None,
     search: str | None = None,
-    is_active: bool | None = None
+    is_active: bool | None = None,
+    after: tuple[datetime, uuid.UUID] | None = None
 ) -> list[Product]:
     query = (
-        select(Product)
+        _filtered_products(category_id, brand_id, search, is_active)
         .options(
             joinedload(Product.brand),
             joinedload(Product.category)
         )
     )
 
-    if is_active is not None:
-        query = query.where(Product.is_active == is_active)
+    # Keyset: la pagina N cuesta lo mismo que la 1 con el indice
+    # (created_at, product_id); con cursor se ignora el offset. Las
+    # busquedas se ordenan por relevancia y paginan solo con offset
+    if after is not None and not search:
+        query = query.where(tuple_(Product.created_at, Product.product_id) < after)
+    else:
+        query = query.offset(offset)
 
-    if category_id:
-        query = query.where(Product.category_id == category_id)
+    # Con busqueda se ordena por relevancia (nombre > marca/categoria > descripcion)
+    if search:
+        query = query.order_by(search_rank(search).desc())
+    query = query.order_by(Product.created_at.desc(), Product.product_id.desc())
+    query = query.limit(limit)
+    
+    result = await session.exec(query)
+    return list(result.unique().all())
 
-    if brand_id:
-        query = query.where(Product.brand_id == brand_id)
+async def get_fuzzy_products(
+    session: AsyncSession,
+    search: str,
+    limit: int,
+    category_id: uuid.UUID | None = None,
+    brand_id: uuid.UUID | None = None,
+    is_active: bool | None = None
+) -> list[Product]:
+    """
+    Reintento por similitud cuando la busqueda full-text no encontro nada.
+    Cada rama del UNION la resuelve su indice gin_trgm_ops; el orden es por
+    el mejor parecido entre nombre y marca.
+    """
+    matches = union(
+        select(Product.product_id).where(fuzzy_condition(Product.name, search)),
+        select(Product.product_id).join(Brand).where(fuzzy_condition(Brand.name, search)),
+        select(ProductVariant.product_id).where(fuzzy_condition(ProductVariant.sku, search))
+    ).subquery()
 
-    if search:
-        query = query.where(
-            or_(
-                Product.name.ilike(f"%{search}%"),
-                Product.description.ilike(f"%{search}%")
-            )
+    query = (
+        _filtered_products(category_id, brand_id, None, is_active)
+        .join(Brand)
+        .where(Product.product_id.in_(select(matches.c.product_id)))
+        .options(
+            joinedload(Product.brand),
+            joinedload(Product.category)
         )
+        .order_by(
+            func.greatest(fuzzy_score(Product.name, search), fuzzy_score(Brand.name, search)).desc(),
+            Product.product_id.desc()
+        )
+        .limit(limit)
+    )
 
-    query = query.order_by(Product.created_at.desc())
-    query = query.offset(offset).limit(limit)
-    
     result = await session.exec(query)
     return list(result.unique().all())
 
+async def get_search_suggestions(
+    session: AsyncSession,
+    search: str,
+    limit: int
+) -> list[dict]:
+    """
+    Terminos conocidos mas parecidos (nombres de producto y marca, SKUs
+    activos de productos activos). Cada rama corta en limit antes de unir,
+    asi ninguna recorre mas filas de las necesarias.
+    """
+    def _closest(column, kind: str, *conditions, join=None):
+        score = fuzzy_score(column, search)
+        # kind como constante SQL: un parametro sin tipo en un UNION no resuelve
+        query = select(column.label("term"), literal_column(f"'{kind}'").label("kind"), score.label("score"))
+        if join is not None:
+            query = query.join(*join)
+        return (
+            query
+            .where(fuzzy_condition(column, search), *conditions)
+            .order_by(score.desc())
+            .limit(limit)
+            .subquery()
+            .select()
+        )
+
+    suggestions = union_all(
+        _closest(Product.name, "product", Product.is_active.is_(True)),
+        _closest(Brand.name, "brand", Brand.is_active.is_(True)),
+        _closest(
+            ProductVariant.sku, "sku",
+            ProductVariant.is_active.is_(True), Product.is_active.is_(True),
+            join=(Product, ProductVariant.product_id == Product.product_id)
+        )
+    ).subquery()
+
+    query = select(suggestions).order_by(suggestions.c.score.desc(), suggestions.c.term).limit(limit)
+    result = await session.execute(query)
+    return [dict(row) for row in result.mappings().all()]
+
+async def count_products(
+    session: AsyncSession,
+    mode: CountMode,
+    category_id: uuid.UUID | None = None,
+    brand_id: uuid.UUID | None = None,
+    search: str | None = None,
+    is_active: bool | None = None
+) -> tuple[int, CountMode]:
+    return await count_rows(
+        session,
+        _filtered_products(category_id, brand_id, search, is_active),
+        mode,
+        Product.__tablename__,
+        (category_id, brand_id, search, is_active)
+    )
+
 async def update_product(
     session: AsyncSession,
     product_id: uuid.UUID,
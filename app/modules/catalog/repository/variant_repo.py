@@ -1,7 +1,10 @@
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlmodel import select
+from sqlalchemy import tuple_
 from sqlalchemy.orm import joinedload
 from sqlalchemy.exc import IntegrityError
+from datetime import datetime
+from app.core.counting import CountMode, count_rows
 import uuid
 from app.modules.catalog.models import ProductVariant, Product
 from app.modules.catalog.schemas import ProductVariantCreate
@@ -32,34 +35,62 @@ async def add_variant(
     await session.refresh(new_variant, ["product"])
     return new_variant
     
+def _filtered_variants(
+    product_id: uuid.UUID,
+    is_active: bool | None = None
+):
+    query = select(ProductVariant)
+
+    if is_active is not None:
+        query = query.where(ProductVariant.is_active == is_active)
+
+    if product_id:
+        query = query.where(ProductVariant.product_id == product_id)
+    return query
+
 async def get_all_product_variants(
     session: AsyncSession,
     offset: int,
     limit: int,
     product_id: uuid.UUID,
-    is_active: bool | None = None
+    is_active: bool | None = None,
+    after: tuple[datetime, uuid.UUID] | None = None
 ) -> list[ProductVariant]:
     
     query = (
-        select(ProductVariant)
+        _filtered_variants(product_id, is_active)
         .options(
             joinedload(ProductVariant.product).joinedload(Product.category),
             joinedload(ProductVariant.product).joinedload(Product.brand)
         )
     )
 
-    if is_active is not None:
-        query = query.where(ProductVariant.is_active == is_active)
-
-    if product_id:
-        query = query.where(ProductVariant.product_id == product_id)
+    # Keyset sobre (created_at, variant_id); con cursor se ignora el offset
+    if after is not None:
+        query = query.where(tuple_(ProductVariant.created_at, ProductVariant.variant_id) < after)
+    else:
+        query = query.offset(offset)
 
-    query = query.order_by(ProductVariant.created_at.desc())
-    query = query.offset(offset).limit(limit)
+    query = query.order_by(ProductVariant.created_at.desc(), ProductVariant.variant_id.desc())
+    query = query.limit(limit)
     
     result = await session.exec(query)
     return list(result.unique().all())
 
+async def count_product_variants(
+    session: AsyncSession,
+    mode: CountMode,
+    product_id: uuid.UUID,
+    is_active: bool | None = None
+) -> tuple[int, CountMode]:
+    return await count_rows(
+        session,
+        _filtered_variants(product_id, is_active),
+        mode,
+        ProductVariant.__tablename__,
+        (product_id, is_active)
+    )
+
 async def get_variant_by_id(
     session: AsyncSession,
     variant_id: uuid.UUID,
@@ -1,8 +1,11 @@
 from fastapi import APIRouter
-from . import categories, brands, products, variants
+from app.core.dependencies import PublicTimeout, CatalogProfile
+from . import categories, brands, products, variants, autocomplete
 
-catalog_router = APIRouter(prefix="/catalog")
+# Rutas publicas con el timeout mas estricto, las de admin lo amplian
+catalog_router = APIRouter(prefix="/catalog", dependencies=[PublicTimeout, CatalogProfile])
 catalog_router.include_router(categories.router)
 catalog_router.include_router(brands.router)
 catalog_router.include_router(products.router)
-catalog_router.include_router(variants.router)
\ No newline at end of file
+catalog_router.include_router(variants.router)
+catalog_router.include_router(autocomplete.router)
\ No newline at end of file
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Query
+from app.modules.catalog.autocomplete import autocomplete_index
+from app.modules.catalog.schemas import AutocompleteEntry
+
+router = APIRouter(prefix="/autocomplete", tags=["Autocomplete"])
+
+
+# Se responde desde el indice en memoria del worker: no abre sesion de BD
+@router.get(
+    "",
+    response_model=list[AutocompleteEntry],
+    summary="Search-as-you-type over active product, brand, category names and SKUs"
+)
+async def autocomplete(
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(default=8, ge=1, le=20)
+):
+    return autocomplete_index.search(q, limit)
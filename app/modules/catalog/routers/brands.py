@@ -1,7 +1,15 @@
 from app.modules.catalog import service as serv
-from app.core.dependencies import SessionDep, CurrentAdmin, CurrentUserOptional
+from app.core.dependencies import (
+    SessionDep,
+    ReadSessionDep,
+    CatalogWriter,
+    CurrentUserOptional,
+    AdminTimeout,
+    AdminProfile
+)
 import uuid
-from fastapi import APIRouter, status, Query
+from fastapi import APIRouter, Response, status, Query
+from app.core.counting import CountMode, set_total_count
 from app.modules.catalog.schemas import (
     BrandCreate, 
     BrandRead, 
@@ -15,11 +23,12 @@ router = APIRouter(prefix="/brands", tags=["Brands"])
     "/",
     response_model=BrandRead,
     status_code=status.HTTP_201_CREATED,
-    summary="Create a new brand for your products"
+    summary="Create a new brand for your products",
+    dependencies=[AdminTimeout, AdminProfile]
 )
 async def create_brand(
     session: SessionDep,
-    admin: CurrentAdmin,
+    admin: CatalogWriter,
     body: BrandCreate
 ):
     return await serv.create_brand(session, body)
@@ -31,7 +40,7 @@ async def create_brand(
     summary="Get a brand by its id (Admins see all, Guests see active only)"
 )
 async def get_brand(
-    session: SessionDep,
+    session: ReadSessionDep,
     brand_id: uuid.UUID,
     user: CurrentUserOptional
 ):
@@ -53,11 +62,13 @@ async def get_brand(
     summary="List brands (Admins see all, Guests see active only)"
 )
 async def list_brands(
-    session: SessionDep,
+    session: ReadSessionDep,
     user: CurrentUserOptional,
+    response: Response,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=10, ge=0, le=100),
-    is_active: bool | None = None
+    is_active: bool | None = None,
+    count: CountMode | None = None
 ):
     is_admin = False
     
@@ -68,20 +79,26 @@ async def list_brands(
     if is_admin:
         filter_active_state = is_active
         
-    return await serv.list_brands(
+    brands = await serv.list_brands(
         session, 
         offset=offset, 
         limit=limit, 
         is_active=filter_active_state
     )
+
+    if count:
+        total, kind = await serv.count_brands(session, count, filter_active_state)
+        set_total_count(response, total, kind)
+    return brands
 @router.patch(
     "/{brand_id}",
     response_model=BrandRead,
-    summary="Update an existing brand by its id"
+    summary="Update an existing brand by its id",
+    dependencies=[AdminTimeout, AdminProfile]
 )
 async def edit_brand(
     session: SessionDep,
-    admin: CurrentAdmin,
+    admin: CatalogWriter,
     brand_id: uuid.UUID,
     body: BrandUpdate
 ):
@@ -90,11 +107,12 @@ async def edit_brand(
 @router.delete(
     "/{brand_id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    summary="Delete an existing brand by its id"
+    summary="Delete an existing brand by its id",
+    dependencies=[AdminTimeout, AdminProfile]
 )
 async def delete_brand(
     session: SessionDep,
-    admin: CurrentAdmin,
+    admin: CatalogWriter,
     brand_id: uuid.UUID
 ):
     await serv.delete_brand(session, brand_id)
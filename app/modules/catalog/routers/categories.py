@@ -1,7 +1,15 @@
 from app.modules.catalog import service as serv
-from app.core.dependencies import SessionDep, CurrentAdmin, CurrentUserOptional
+from app.core.dependencies import (
+    SessionDep,
+    ReadSessionDep,
+    CatalogWriter,
+    CurrentUserOptional,
+    AdminTimeout,
+    AdminProfile
+)
 import uuid
-from fastapi import APIRouter, status, Query
+from fastapi import APIRouter, Response, status, Query
+from app.core.counting import CountMode, set_total_count
 from app.modules.catalog.schemas import (
     CategoryCreate, 
     CategoryRead, 
@@ -14,11 +22,12 @@ router = APIRouter(prefix="/categories", tags=["Categories"])
     "/",
     response_model=CategoryRead,
     status_code=status.HTTP_201_CREATED,
-    summary="Create a new category for your products"
+    summary="Create a new category for your products",
+    dependencies=[AdminTimeout, AdminProfile]
 )
 async def create_category(
     session: SessionDep,
-    admin: CurrentAdmin,
+    admin: CatalogWriter,
     body: CategoryCreate
 ):
     return await serv.create_category(session, body)
@@ -30,7 +39,7 @@ async def create_category(
     summary="Get a category by its id (Admins see all, Guests see active only)"
 )
 async def get_category(
-    session: SessionDep,
+    session: ReadSessionDep,
     category_id: uuid.UUID,
     user: CurrentUserOptional
 ):
@@ -52,11 +61,13 @@ async def get_category(
     summary="List categories (Admins see all, Guests see active only)"
 )
 async def list_categories(
-    session: SessionDep,
+    session: ReadSessionDep,
     user: CurrentUserOptional,
+    response: Response,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=10, ge=0, le=100),
-    is_active: bool | None = None
+    is_active: bool | None = None,
+    count: CountMode | None = None
 ):
     is_admin = False
     
@@ -67,21 +78,27 @@ async def list_categories(
     if is_admin:
         filter_active_state = is_active
 
-    return await serv.list_categories(
+    categories = await serv.list_categories(
         session, 
         offset=offset, 
         limit=limit, 
         is_active=filter_active_state
     )
 
+    if count:
+        total, kind = await serv.count_categories(session, count, filter_active_state)
+        set_total_count(response, total, kind)
+    return categories
+
 @router.patch(
     "/{category_id}",
     response_model=CategoryRead,
-    summary="Update an existing category by its id"
+    summary="Update an existing category by its id",
+    dependencies=[AdminTimeout, AdminProfile]
 )
 async def edit_category(
     session: SessionDep,
-    admin: CurrentAdmin,
+    admin: CatalogWriter,
     category_id: uuid.UUID,
     body: CategoryUpdate
 ):
@@ -90,11 +107,12 @@ async def edit_category(
 @router.delete(
     "/{category_id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    summary="Delete an existing category by its id"
+    summary="Delete an existing category by its id",
+    dependencies=[AdminTimeout, AdminProfile]
 )
 async def delete_category(
     session: SessionDep,
-    admin: CurrentAdmin,
+    admin: CatalogWriter,
     category_id: uuid.UUID
 ) -> None:
     await serv.delete_category(session, category_id)
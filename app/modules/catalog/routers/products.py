@@ -1,11 +1,24 @@
 from app.modules.catalog import service as serv
-from app.core.dependencies import SessionDep, CurrentAdmin, CurrentUserOptional
+from app.core.dependencies import (
+    SessionDep,
+    ReadSessionDep,
+    CatalogWriter,
+    CurrentUserOptional,
+    AdminTimeout,
+    AdminProfile,
+    SearchTimeout,
+    PageCursor
+)
+from app.core.pagination import NEXT_CURSOR_HEADER, next_cursor
+from app.core.counting import CountMode, set_total_count
+from app.modules.catalog.search import FUZZY_FALLBACK_HEADER
 import uuid
-from fastapi import APIRouter, status, Query
+from fastapi import APIRouter, Response, status, Query
 from app.modules.catalog.schemas import (
     ProductCreate, 
     ProductRead, 
-    ProductUpdate
+    ProductUpdate,
+    SearchSuggestion
 )
 
 router = APIRouter(prefix="/products", tags=["Products"])
@@ -15,22 +28,36 @@ router = APIRouter(prefix="/products", tags=["Products"])
     "/",
     response_model=ProductRead,
     status_code=status.HTTP_201_CREATED,
-    summary="Create a new product for your catalog"
+    summary="Create a new product for your catalog",
+    dependencies=[AdminTimeout, AdminProfile]
 )
 async def create_product(
     session: SessionDep,
-    admin: CurrentAdmin,
+    admin: CatalogWriter,
     body: ProductCreate
 ):
     return await serv.create_product(session, body)
 
+@router.get(
+    "/suggestions",
+    response_model=list[SearchSuggestion],
+    summary="Closest known product names, brands and SKUs for a search term",
+    dependencies=[SearchTimeout]
+)
+async def suggest_products(
+    session: ReadSessionDep,
+    search: str = Query(min_length=2, max_length=100),
+    limit: int = Query(default=5, ge=1, le=20)
+):
+    return await serv.suggest_search_terms(session, search, limit)
+
 @router.get(
     "/{product_id}",
     response_model=ProductRead,
     summary="Get a product by its id (Admins see all, Guests see active only)"
 )
 async def get_product(
-    session: SessionDep,
+    session: ReadSessionDep,
     product_id: uuid.UUID,
     user: CurrentUserOptional
 ):
@@ -49,17 +76,21 @@ async def get_product(
 @router.get(
     "/",
     response_model=list[ProductRead],
-    summary="List products (Admins see all, Guests see active only)"
+    summary="List products (Admins see all, Guests see active only)",
+    dependencies=[SearchTimeout]
 )
 async def list_products(
-    session: SessionDep,
+    session: ReadSessionDep,
     user: CurrentUserOptional,
+    response: Response,
+    cursor: PageCursor,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=10, ge=0, le=100),
     category_id: uuid.UUID | None = None,
     brand_id: uuid.UUID | None = None,
     search: str | None = None,
-    is_active: bool | None = None
+    is_active: bool | None = None,
+    count: CountMode | None = None
 ):
     # Determinar si es admin
     is_admin_user = user is not None and user.role == "admin"
@@ -70,24 +101,61 @@ async def list_products(
     if is_admin_user:
         filter_active_state = is_active
 
-    return await serv.list_products(
+    products = await serv.list_products(
         session, 
         offset=offset, 
         limit=limit, 
         is_active=filter_active_state,
         category_id=category_id,
         brand_id=brand_id,
-        search=search
+        search=search,
+        after=cursor
     )
 
+    # Sin resultados en la primera pagina: reintento tolerante a errores de tipeo
+    fuzzy = bool(search) and not products and offset == 0 and cursor is None
+    if fuzzy:
+        products = await serv.fuzzy_search_products(
+            session,
+            search,
+            limit,
+            category_id=category_id,
+            brand_id=brand_id,
+            is_active=filter_active_state
+        )
+        response.headers[FUZZY_FALLBACK_HEADER] = "fuzzy"
+
+    # Cursor de la pagina siguiente; el offset sigue funcionando igual.
+    # Las busquedas van por relevancia, no por created_at: sin cursor
+    cursor_token = None if search else next_cursor(products, limit, "product_id")
+    if cursor_token:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_token
+
+    # Total opcional (X-Total-Count) para la UI de paginacion; el
+    # reintento por similitud es una sola pagina, su total es lo devuelto
+    if count and fuzzy:
+        set_total_count(response, len(products), "exact")
+    elif count:
+        total, kind = await serv.count_products(
+            session,
+            count,
+            category_id=category_id,
+            brand_id=brand_id,
+            search=search,
+            is_active=filter_active_state
+        )
+        set_total_count(response, total, kind)
+    return products
+
 @router.patch(
     "/{product_id}",
     response_model=ProductRead,
-    summary="Update an existing product by its id"
+    summary="Update an existing product by its id",
+    dependencies=[AdminTimeout, AdminProfile]
 )
 async def edit_product(
     session: SessionDep,
-    admin: CurrentAdmin,
+    admin: CatalogWriter,
     product_id: uuid.UUID,
     body: ProductUpdate
 ):
@@ -96,11 +164,12 @@ async def edit_product(
 @router.delete(
     "/{product_id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    summary="Delete an existing product by its id, if the product has variants, it will not be deleted"
+    summary="Delete an existing product by its id, if the product has variants, it will not be deleted",
+    dependencies=[AdminTimeout, AdminProfile]
 )
 async def delete_product(
     session: SessionDep,
-    admin: CurrentAdmin,
+    admin: CatalogWriter,
     product_id: uuid.UUID
 ):
     await serv.delete_product(session, product_id)
@@ -1,8 +1,18 @@
 from fastapi import APIRouter
 from app.modules.catalog import service as serv
-from app.core.dependencies import SessionDep, CurrentAdmin, CurrentUserOptional
+from app.core.dependencies import (
+    SessionDep,
+    ReadSessionDep,
+    CatalogWriter,
+    CurrentUserOptional,
+    AdminTimeout,
+    AdminProfile,
+    PageCursor
+)
+from app.core.pagination import NEXT_CURSOR_HEADER, next_cursor
+from app.core.counting import CountMode, set_total_count
 import uuid
-from fastapi import status, Query
+from fastapi import Response, status, Query
 from app.modules.catalog.schemas import (
     ProductVariantCreate, 
     ProductVariantRead, 
@@ -15,11 +25,12 @@ router = APIRouter(tags=["Variants"])
     "/products/{product_id}/variants",
     response_model=ProductVariantRead,
     status_code=status.HTTP_201_CREATED,
-    summary="Create a new variant for your products"
+    summary="Create a new variant for your products",
+    dependencies=[AdminTimeout, AdminProfile]
 )
 async def create_variant(
     session: SessionDep,
-    admin: CurrentAdmin,
+    admin: CatalogWriter,
     product_id: uuid.UUID,
     body: ProductVariantCreate
 ):
@@ -32,12 +43,15 @@ async def create_variant(
     summary="Get all variants for a product"
 )
 async def list_variants(
-    session: SessionDep,
+    session: ReadSessionDep,
     user: CurrentUserOptional,
+    response: Response,
+    cursor: PageCursor,
     product_id: uuid.UUID,
     offset: int = Query(default=0, ge=0),
     limit: int = Query(default=10, ge=0, le=100),
-    is_active: bool | None = None
+    is_active: bool | None = None,
+    count: CountMode | None = None
 ):
     # Determinar si es admin
     is_admin_user = user is not None and user.role == "admin"
@@ -48,14 +62,24 @@ async def list_variants(
     if is_admin_user:
         filter_active_state = is_active
 
-    return await serv.list_variants(
+    variants = await serv.list_variants(
         session, 
         offset=offset, 
         limit=limit, 
         is_active=filter_active_state,
-        product_id=product_id
+        product_id=product_id,
+        after=cursor
     )
 
+    cursor_token = next_cursor(variants, limit, "variant_id")
+    if cursor_token:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_token
+
+    if count:
+        total, kind = await serv.count_variants(session, count, product_id, filter_active_state)
+        set_total_count(response, total, kind)
+    return variants
+
 @router.get(
     "/variants/{variant_id}",
     response_model=ProductVariantRead,
@@ -63,7 +87,7 @@ async def list_variants(
     summary="Get a variant by ID"
 )
 async def get_variant(
-    session: SessionDep,
+    session: ReadSessionDep,
     user: CurrentUserOptional,
     variant_id: uuid.UUID,
 ):
@@ -83,11 +107,12 @@ async def get_variant(
     "/variants/{variant_id}",
     response_model=ProductVariantRead,
     status_code=status.HTTP_200_OK,
-    summary="Update a variant"
+    summary="Update a variant",
+    dependencies=[AdminTimeout, AdminProfile]
 )
 async def update_variant(
     session: SessionDep,
-    admin: CurrentAdmin,
+    admin: CatalogWriter,
     variant_id: uuid.UUID,
     body: ProductVariantUpdate
 ):
@@ -96,11 +121,12 @@ async def update_variant(
 @router.delete(
     "/variants/{variant_id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    summary="Delete an existing variant by ID, if the variant is associated with orders, it will not be deleted"
+    summary="Delete an existing variant by ID, if the variant is associated with orders, it will not be deleted",
+    dependencies=[AdminTimeout, AdminProfile]
 )
 async def delete_variant(
     session: SessionDep,
-    admin: CurrentAdmin,
+    admin: CatalogWriter,
     variant_id: uuid.UUID
 ):
     return await serv.delete_variant(session, variant_id)
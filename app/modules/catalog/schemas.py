@@ -1,6 +1,7 @@
 from sqlmodel import SQLModel, Field
 from app.core.types import CleanText, CleanCode
 from datetime import datetime
+from typing import Literal
 import uuid
 from decimal import Decimal
 
@@ -106,4 +107,16 @@ class ProductVariantRead(ProductVariantBase):
     is_active: bool
     created_at: datetime
     updated_at: datetime
-    product: ProductBasic
\ No newline at end of file
+    product: ProductBasic
+
+
+# --- Sugerencias de busqueda ("quisiste decir") ---
+class SearchSuggestion(SQLModel):
+    term: str
+    kind: Literal["product", "brand", "sku"]
+    score: float
+
+
+class AutocompleteEntry(SQLModel):
+    term: str
+    kind: Literal["product", "brand", "category", "sku"]
@@ -0,0 +1,119 @@
+# Busqueda full-text de productos. product.search_vector combina, con pesos,
+# el nombre (A), la marca y la categoria (B) y la descripcion (C), usando la
+# configuracion spanish_unaccent: stemming en español y sin tildes
+# ("gráfica" y "graficas" encuentran lo mismo). Como incluye columnas de
+# otras tablas no puede ser una columna generada: la mantienen triggers.
+# La migracion 0a4c8e6f2b17 tiene una copia congelada de este DDL; aqui
+# se engancha a create_all para las BD de tests.
+#
+# Si la busqueda no encuentra nada se reintenta por similitud de trigramas
+# (pg_trgm) contra nombre, marca y SKU, para tolerar errores de tipeo.
+from sqlalchemy import DDL, cast, event, func, literal
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlmodel import SQLModel
+from app.modules.catalog.models import Product
+
+SEARCH_CONFIG = "spanish_unaccent"
+
+# Marca las respuestas que salen del reintento por similitud
+FUZZY_FALLBACK_HEADER = "X-Search-Fallback"
+
+SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    f"""
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = '{SEARCH_CONFIG}') THEN
+            CREATE TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} (COPY = pg_catalog.spanish);
+            ALTER TEXT SEARCH CONFIGURATION {SEARCH_CONFIG}
+                ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+        END IF;
+    END
+    $$
+    """,
+    f"""
+    CREATE OR REPLACE FUNCTION product_search_vector_refresh() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.name, '')), 'A') ||
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(
+                (SELECT name FROM brand WHERE brand_id = NEW.brand_id), '')), 'B') ||
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(
+                (SELECT name FROM category WHERE category_id = NEW.category_id), '')), 'B') ||
+            setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.description, '')), 'C');
+        RETURN NEW;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER product_search_vector
+    BEFORE INSERT OR UPDATE OF name, description, brand_id, category_id ON product
+    FOR EACH ROW EXECUTE FUNCTION product_search_vector_refresh()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION product_search_vector_parent_renamed() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        -- SET name = name dispara product_search_vector en cada producto afectado
+        IF TG_TABLE_NAME = 'brand' THEN
+            UPDATE product SET name = name WHERE brand_id = NEW.brand_id;
+        ELSE
+            UPDATE product SET name = name WHERE category_id = NEW.category_id;
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER brand_renamed_product_search
+    AFTER UPDATE OF name ON brand
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION product_search_vector_parent_renamed()
+    """,
+    """
+    CREATE TRIGGER category_renamed_product_search
+    AFTER UPDATE OF name ON category
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION product_search_vector_parent_renamed()
+    """,
+]
+
+# brand y category ya existen cuando se crea product (tiene FK a ambas)
+for statement in SEARCH_DDL:
+    event.listen(Product.__table__, "after_create", DDL(statement))
+
+# Los indices gin_trgm_ops de los modelos necesitan la extension antes que las tablas
+TRIGRAM_DDL = "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+event.listen(SQLModel.metadata, "before_create", DDL(TRIGRAM_DDL))
+
+
+search_vector = Product.__table__.c.search_vector
+
+
+def search_query(term: str):
+    # websearch_to_tsquery acepta texto libre del usuario sin errores de sintaxis
+    return func.websearch_to_tsquery(cast(literal(SEARCH_CONFIG), REGCONFIG), term)
+
+
+def search_condition(term: str):
+    """search_vector @@ query: lo resuelve el indice GIN ix_product_search_vector"""
+    return search_vector.op("@@")(search_query(term))
+
+
+def search_rank(term: str):
+    return func.ts_rank_cd(search_vector, search_query(term))
+
+
+def fuzzy_condition(column, term: str):
+    """
+    term <% column: word_similarity por encima de pg_trgm.word_similarity_threshold
+    (lo fija SearchTimeout). Compara el termino con el tramo mas parecido de la
+    columna, asi "rtx 4600" encuentra "Gaming GeForce RTX 4060". Usa los indices
+    gin_trgm_ops.
+    """
+    return literal(term).op("<%")(column)
+
+
+def fuzzy_score(column, term: str):
+    return func.word_similarity(term, column)
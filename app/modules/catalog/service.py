@@ -2,6 +2,7 @@ from app.modules.catalog.repository import category_repo as cat_repo
 from app.modules.catalog.repository import brand_repo as brand_repo
 from app.modules.catalog.repository import product_repo as prod_repo
 from app.modules.catalog.repository import variant_repo as var_repo
+from app.modules.catalog.repository import fast_repo
 from app.modules.catalog.models import Category, Brand, Product, ProductVariant
 from app.modules.catalog.schemas import (
     CategoryCreate, 
@@ -15,6 +16,9 @@ from app.modules.catalog.schemas import (
 )
 from sqlmodel.ext.asyncio.session import AsyncSession
 from slugify import slugify
+from app.core.counting import CountMode
+from app.core.config import settings
+from datetime import datetime
 import uuid
 
 def _generate_sku(
@@ -56,6 +60,13 @@ async def list_categories(
 ) -> list[Category]:
     return await cat_repo.get_all_categories(session, offset, limit, is_active)
 
+async def count_categories(
+    session: AsyncSession,
+    mode: CountMode,
+    is_active: bool | None = True
+) -> tuple[int, CountMode]:
+    return await cat_repo.count_categories(session, mode, is_active)
+
 async def edit_category(
     session: AsyncSession,
     category_id: uuid.UUID,
@@ -94,6 +105,13 @@ async def list_brands(
 ) -> list[Brand]:
     return await brand_repo.get_all_brands(session, offset, limit, is_active)
 
+async def count_brands(
+    session: AsyncSession,
+    mode: CountMode,
+    is_active: bool | None = True
+) -> tuple[int, CountMode]:
+    return await brand_repo.count_brands(session, mode, is_active)
+
 async def edit_brand(
     session: AsyncSession,
     brand_id: uuid.UUID,
@@ -140,6 +158,8 @@ async def get_product(
     product_id: uuid.UUID,
     only_active: bool
 ) -> Product:
+    if fast_repo.enabled():
+        return await fast_repo.get_product(session, product_id, only_active)
     return await prod_repo.get_product(session, product_id, only_active)
 
 async def list_products(
@@ -149,9 +169,43 @@ async def list_products(
     category_id: uuid.UUID | None = None,
     brand_id: uuid.UUID | None = None,
     search: str | None = None,
+    is_active: bool | None = None,
+    after: tuple[datetime, uuid.UUID] | None = None
+) -> list[Product]:
+    # Listado por defecto (sin filtros) por el camino rapido
+    if fast_repo.enabled() and not (category_id or brand_id or search):
+        return await fast_repo.get_all_products(session, offset, limit, is_active, after)
+    return await prod_repo.get_all_products(session, offset, limit, category_id, brand_id, search, is_active, after)
+
+async def fuzzy_search_products(
+    session: AsyncSession,
+    search: str,
+    limit: int,
+    category_id: uuid.UUID | None = None,
+    brand_id: uuid.UUID | None = None,
     is_active: bool | None = None
 ) -> list[Product]:
-    return await prod_repo.get_all_products(session, offset, limit, category_id, brand_id, search, is_active)
+    # Una sola pagina acotada: el reintento no pagina
+    limit = min(limit, settings.search_fuzzy_max_results)
+    return await prod_repo.get_fuzzy_products(session, search, limit, category_id, brand_id, is_active)
+
+async def suggest_search_terms(
+    session: AsyncSession,
+    search: str,
+    limit: int
+) -> list[dict]:
+    limit = min(limit, settings.search_suggest_max_results)
+    return await prod_repo.get_search_suggestions(session, search, limit)
+
+async def count_products(
+    session: AsyncSession,
+    mode: CountMode,
+    category_id: uuid.UUID | None = None,
+    brand_id: uuid.UUID | None = None,
+    search: str | None = None,
+    is_active: bool | None = None
+) -> tuple[int, CountMode]:
+    return await prod_repo.count_products(session, mode, category_id, brand_id, search, is_active)
 
 async def edit_product(
     session: AsyncSession,
@@ -234,15 +288,26 @@ async def list_variants(
     offset: int,
     limit: int,
     product_id: uuid.UUID,
-    is_active: bool | None = None
+    is_active: bool | None = None,
+    after: tuple[datetime, uuid.UUID] | None = None
 ) -> list[ProductVariant]:
-    return await var_repo.get_all_product_variants(session, offset, limit, product_id, is_active)
+    return await var_repo.get_all_product_variants(session, offset, limit, product_id, is_active, after)
+
+async def count_variants(
+    session: AsyncSession,
+    mode: CountMode,
+    product_id: uuid.UUID,
+    is_active: bool | None = None
+) -> tuple[int, CountMode]:
+    return await var_repo.count_product_variants(session, mode, product_id, is_active)
 
 async def get_variant(
     session: AsyncSession,
     variant_id: uuid.UUID,
     only_active: bool
 ) -> ProductVariant:
+    if fast_repo.enabled():
+        return await fast_repo.get_variant_by_id(session, variant_id, only_active)
     return await var_repo.get_variant_by_id(session, variant_id, only_active)
 
 async def update_variant(
@@ -0,0 +1,108 @@
+"""add product full text search
+
+Revision ID: 0a4c8e6f2b17
+Revises: e3b7a9d1c5f2
+Create Date: 2026-10-18 18:02:11.540317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a4c8e6f2b17'
+down_revision: Union[str, Sequence[str], None] = 'e3b7a9d1c5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# DDL congelado de esta revision (app/modules/catalog/search.py lo repite
+# para create_all en los tests)
+SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'spanish_unaccent') THEN
+            CREATE TEXT SEARCH CONFIGURATION spanish_unaccent (COPY = pg_catalog.spanish);
+            ALTER TEXT SEARCH CONFIGURATION spanish_unaccent
+                ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+        END IF;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION product_search_vector_refresh() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('spanish_unaccent', coalesce(NEW.name, '')), 'A') ||
+            setweight(to_tsvector('spanish_unaccent', coalesce(
+                (SELECT name FROM brand WHERE brand_id = NEW.brand_id), '')), 'B') ||
+            setweight(to_tsvector('spanish_unaccent', coalesce(
+                (SELECT name FROM category WHERE category_id = NEW.category_id), '')), 'B') ||
+            setweight(to_tsvector('spanish_unaccent', coalesce(NEW.description, '')), 'C');
+        RETURN NEW;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER product_search_vector
+    BEFORE INSERT OR UPDATE OF name, description, brand_id, category_id ON product
+    FOR EACH ROW EXECUTE FUNCTION product_search_vector_refresh()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION product_search_vector_parent_renamed() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        -- SET name = name dispara product_search_vector en cada producto afectado
+        IF TG_TABLE_NAME = 'brand' THEN
+            UPDATE product SET name = name WHERE brand_id = NEW.brand_id;
+        ELSE
+            UPDATE product SET name = name WHERE category_id = NEW.category_id;
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE TRIGGER brand_renamed_product_search
+    AFTER UPDATE OF name ON brand
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION product_search_vector_parent_renamed()
+    """,
+    """
+    CREATE TRIGGER category_renamed_product_search
+    AFTER UPDATE OF name ON category
+    FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION product_search_vector_parent_renamed()
+    """,
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('product', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # Extension unaccent, configuracion de busqueda, funciones y triggers
+    for statement in SEARCH_DDL:
+        op.execute(statement)
+
+    # Backfill: SET name = name dispara el trigger en cada fila
+    op.execute("UPDATE product SET name = name")
+
+    op.create_index('ix_product_search_vector', 'product', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_product_search_vector', table_name='product', postgresql_using='gin')
+    op.execute("DROP TRIGGER IF EXISTS category_renamed_product_search ON category")
+    op.execute("DROP TRIGGER IF EXISTS brand_renamed_product_search ON brand")
+    op.execute("DROP TRIGGER IF EXISTS product_search_vector ON product")
+    op.execute("DROP FUNCTION IF EXISTS product_search_vector_parent_renamed()")
+    op.execute("DROP FUNCTION IF EXISTS product_search_vector_refresh()")
+    op.execute("DROP TEXT SEARCH CONFIGURATION IF EXISTS spanish_unaccent")
+    op.drop_column('product', 'search_vector')
@@ -0,0 +1,42 @@
+"""add trigram search indexes
+
+Revision ID: 5d2b8f0e3a61
+Revises: 0a4c8e6f2b17
+Create Date: 2026-10-18 18:41:37.208954
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2b8f0e3a61'
+down_revision: Union[str, Sequence[str], None] = '0a4c8e6f2b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_product_name_trgm', 'product', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_brand_name_trgm', 'brand', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_product_variant_sku_trgm', 'product_variant', ['sku'], unique=False,
+        postgresql_using='gin', postgresql_ops={'sku': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # La extension pg_trgm se deja: otros objetos de la BD pueden usarla
+    op.drop_index('ix_product_variant_sku_trgm', table_name='product_variant', postgresql_using='gin')
+    op.drop_index('ix_brand_name_trgm', table_name='brand', postgresql_using='gin')
+    op.drop_index('ix_product_name_trgm', table_name='product', postgresql_using='gin')
@@ -0,0 +1,34 @@
+"""add keyset pagination indexes
+
+Revision ID: e3b7a9d1c5f2
+Revises: c6d8e2f4a1b9
+Create Date: 2026-10-18 17:26:44.093115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b7a9d1c5f2'
+down_revision: Union[str, Sequence[str], None] = 'c6d8e2f4a1b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_product_created_at_product_id', 'product', ['created_at', 'product_id'], unique=False)
+    op.create_index(
+        'ix_product_variant_product_id_created_at',
+        'product_variant',
+        ['product_id', 'created_at', 'variant_id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_product_variant_product_id_created_at', table_name='product_variant')
+    op.drop_index('ix_product_created_at_product_id', table_name='product')
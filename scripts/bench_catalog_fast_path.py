@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import time
+from sqlmodel import select
+
+from app.core.db import ReadSessionLocal
+from app.modules.catalog.models import Product, ProductVariant
+from app.modules.catalog.repository import product_repo as prod_repo
+from app.modules.catalog.repository import variant_repo as var_repo
+from app.modules.catalog.repository import fast_repo
+from app.modules.catalog.schemas import ProductRead, ProductVariantRead
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ITERATIONS = 2000
+
+
+async def measure(name: str, call) -> None:
+    """
+    Ejecuta la misma lectura ITERATIONS veces y reporta el CPU del proceso
+    por peticion (process_time) junto al tiempo de reloj.
+    """
+    await call()  # calentamiento: prepara statements y caches
+
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await call()
+    cpu = (time.process_time() - cpu_start) / ITERATIONS
+    wall = (time.perf_counter() - wall_start) / ITERATIONS
+
+    logger.info(f"{name:<28} cpu {cpu * 1e6:8.1f} us/req   wall {wall * 1e6:8.1f} us/req")
+
+
+async def main():
+    async with ReadSessionLocal() as session:
+        product_id = (await session.exec(select(Product.product_id).limit(1))).first()
+        variant_id = (await session.exec(select(ProductVariant.variant_id).limit(1))).first()
+
+        if product_id is None or variant_id is None:
+            logger.error("Se necesita al menos un producto con una variante en la BD")
+            return
+
+        # Cada lectura incluye la validacion del response_model que hace FastAPI
+        async def orm_product():
+            product = await prod_repo.get_product(session, product_id, True)
+            ProductRead.model_validate(product, from_attributes=True)
+            session.expunge_all()
+
+        async def fast_product():
+            product = await fast_repo.get_product(session, product_id, True)
+            ProductRead.model_validate(product, from_attributes=True)
+
+        async def orm_list():
+            products = await prod_repo.get_all_products(session, 0, 10, is_active=True)
+            for product in products:
+                ProductRead.model_validate(product, from_attributes=True)
+            session.expunge_all()
+
+        async def fast_list():
+            products = await fast_repo.get_all_products(session, 0, 10, is_active=True)
+            for product in products:
+                ProductRead.model_validate(product, from_attributes=True)
+
+        async def orm_variant():
+            variant = await var_repo.get_variant_by_id(session, variant_id, True)
+            ProductVariantRead.model_validate(variant, from_attributes=True)
+            session.expunge_all()
+
+        async def fast_variant():
+            variant = await fast_repo.get_variant_by_id(session, variant_id, True)
+            ProductVariantRead.model_validate(variant, from_attributes=True)
+
+        logger.info(f"Benchmark camino ORM vs camino rapido ({ITERATIONS} iteraciones)")
+        await measure("get_product (ORM)", orm_product)
+        await measure("get_product (fast path)", fast_product)
+        await measure("list_products (ORM)", orm_list)
+        await measure("list_products (fast path)", fast_list)
+        await measure("get_variant (ORM)", orm_variant)
+        await measure("get_variant (fast path)", fast_variant)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+import argparse
+import logging
+import os
+import resource
+import statistics
+import time
+from argon2.low_level import Type, hash_secret_raw
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Candidatos de memory_cost en KiB, de menor a mayor
+MEMORY_CANDIDATES_KIB = [19456, 32768, 47104, 65536, 131072, 262144]
+MAX_TIME_COST = 10
+SAMPLES = 5
+
+
+def measure(time_cost: int, memory_cost: int, parallelism: int) -> float:
+    """Mediana en ms de SAMPLES hashes Argon2id con los parametros dados"""
+    timings = []
+    for _ in range(SAMPLES):
+        start = time.perf_counter()
+        hash_secret_raw(
+            secret=b"calibration-password",
+            salt=os.urandom(16),
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            hash_len=32,
+            type=Type.ID
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def peak_rss_mib() -> float:
+    # ru_maxrss viene en KiB en Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def calibrate(target_ms: float, max_memory_mib: int, parallelism: int) -> tuple[int, int, float] | None:
+    """
+    Recorre memory_cost de menor a mayor y, para cada uno, sube time_cost
+    mientras el hash quede dentro del objetivo. Propone la combinacion con
+    mas memoria (lo que mas encarece un ataque offline) que cumple el objetivo.
+    """
+    proposal = None
+    for memory_cost in MEMORY_CANDIDATES_KIB:
+        if memory_cost > max_memory_mib * 1024:
+            break
+
+        best_for_memory = None
+        for time_cost in range(1, MAX_TIME_COST + 1):
+            latency = measure(time_cost, memory_cost, parallelism)
+            logger.info(
+                f"m={memory_cost // 1024:>4} MiB  t={time_cost:<2} p={parallelism}  "
+                f"{latency:7.1f} ms   peak RSS {peak_rss_mib():7.1f} MiB"
+            )
+            if latency > target_ms:
+                break
+            best_for_memory = (time_cost, memory_cost, latency)
+
+        if best_for_memory is None:
+            # Ni con time_cost=1 entra: mas memoria tampoco va a entrar
+            break
+        proposal = best_for_memory
+
+    return proposal
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Propone parametros de Argon2id para una latencia objetivo en este host"
+    )
+    parser.add_argument("--target-ms", type=float, default=250.0, help="latencia objetivo por hash")
+    parser.add_argument("--max-memory-mib", type=int, default=128, help="memoria maxima por hash")
+    parser.add_argument("--parallelism", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("PASSWORD_HASH_WORKERS", "4")),
+        help="workers del executor de hashing, para estimar capacidad"
+    )
+    args = parser.parse_args()
+
+    logger.info(f"Calibrando Argon2id: objetivo {args.target_ms:.0f} ms, hasta {args.max_memory_mib} MiB")
+    proposal = calibrate(args.target_ms, args.max_memory_mib, args.parallelism)
+
+    if proposal is None:
+        logger.error("Ninguna combinacion cumple el objetivo; sube --target-ms o baja la memoria")
+        return
+
+    time_cost, memory_cost, latency = proposal
+    logger.info(f"Propuesta ({latency:.1f} ms por hash):")
+    logger.info(f"  ARGON2_TIME_COST={time_cost}")
+    logger.info(f"  ARGON2_MEMORY_COST={memory_cost}")
+    logger.info(f"  ARGON2_PARALLELISM={args.parallelism}")
+    logger.info(
+        f"Con {args.workers} workers: ~{args.workers * 1000 / latency:.0f} logins/s por proceso "
+        f"y hasta {args.workers * memory_cost // 1024} MiB de memoria en hashes simultaneos"
+    )
+    logger.info("Los hashes existentes se recalculan solos en el siguiente login exitoso")
+
+
+if __name__ == "__main__":
+    main()
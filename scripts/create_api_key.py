@@ -0,0 +1,50 @@
+import argparse
+import asyncio
+import logging
+
+from app.core.db import AsyncSessionLocal
+from app.core.security import generate_api_key, hash_api_key
+from app.modules.auth.models import ApiKey
+from app.modules.auth import repository as repo
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def create_api_key(name: str, scopes: str):
+    """
+    Crea una API key para una integracion. La clave en claro se muestra
+    una sola vez; en la BD queda solo su HMAC.
+    """
+    api_key = generate_api_key()
+
+    async with AsyncSessionLocal() as session:
+        try:
+            await repo.add_api_key(session, ApiKey(
+                name=name,
+                key_prefix=api_key[:12],
+                key_digest=hash_api_key(api_key),
+                scopes=scopes
+            ))
+            await session.commit()
+
+        except Exception as e:
+            logger.error(f"Error creando la API key: {e}")
+            await session.rollback()
+            raise
+
+    logger.info(f"API key '{name}' creada con scopes '{scopes}'")
+    logger.info(f"Guardala ahora, no se vuelve a mostrar: {api_key}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crea una API key para una integracion")
+    parser.add_argument("name", help="nombre de la integracion, ej. stock-sync")
+    parser.add_argument("--scopes", default="catalog:write", help="scopes separados por espacio")
+    args = parser.parse_args()
+
+    asyncio.run(create_api_key(args.name, args.scopes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import argparse
+import asyncio
+import csv
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import uuid6
+from pydantic import EmailStr, TypeAdapter, ValidationError
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+
+from app.core.db import AsyncSessionLocal
+from app.core.security import hash_password
+from app.modules.auth.models import User, Role
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+email_adapter = TypeAdapter(EmailStr)
+
+# asyncpg admite hasta 32767 parametros por sentencia y cada fila del
+# INSERT usa cinco (user_id, email, role, hashed_password, is_active)
+MAX_BATCH_SIZE = 32767 // 5
+
+
+def read_users(path: str) -> list[dict]:
+    """
+    Lee el CSV (columnas email, password y opcionalmente role, is_active).
+    Descarta filas invalidas y emails repetidos dentro del archivo sin
+    distinguir mayusculas (se queda con la primera aparicion). El email se
+    guarda tal cual: el login lo compara exacto.
+    """
+    users = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                email = email_adapter.validate_python(row["email"].strip())
+                role = Role(row.get("role") or Role.CLIENT.value)
+            except (ValidationError, ValueError, KeyError) as e:
+                logger.warning(f"Linea {line} descartada: {e}")
+                continue
+
+            if not row.get("password"):
+                logger.warning(f"Linea {line} descartada: password vacio")
+                continue
+
+            if email.lower() in users:
+                logger.warning(f"Linea {line} descartada: email {email} repetido en el archivo")
+                continue
+
+            users[email.lower()] = {
+                "email": email,
+                "password": row["password"],
+                "role": role.value,
+                "is_active": (row.get("is_active") or "true").strip().lower() in ("1", "true", "yes")
+            }
+    return list(users.values())
+
+
+async def existing_emails(session, emails: list[str]) -> set[str]:
+    """Emails (en minusculas) que ya tienen cuenta, sin distinguir mayusculas"""
+    lowered = func.lower(User.email)
+    result = await session.exec(select(lowered).where(lowered.in_([email.lower() for email in emails])))
+    return set(result.all())
+
+
+async def provision(path: str, batch_size: int, workers: int):
+    if not 1 <= batch_size <= MAX_BATCH_SIZE:
+        clamped = min(max(batch_size, 1), MAX_BATCH_SIZE)
+        logger.warning(f"--batch-size {batch_size} fuera de rango; se usa {clamped}")
+        batch_size = clamped
+
+    users = read_users(path)
+    logger.info(f"{len(users)} usuarios validos en {path}; hasheando con {workers} procesos")
+
+    inserted = skipped = hashed_count = 0
+    hash_time = insert_time = 0.0
+    loop = asyncio.get_running_loop()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        async with AsyncSessionLocal() as session:
+            for start in range(0, len(users), batch_size):
+                batch = users[start:start + batch_size]
+
+                # Los que ya existen no se hashean: es lo caro
+                known = await existing_emails(session, [user["email"] for user in batch])
+                new_users = [user for user in batch if user["email"].lower() not in known]
+                skipped += len(batch) - len(new_users)
+                batch = new_users
+                if not batch:
+                    continue
+
+                t0 = time.perf_counter()
+                hashes = await asyncio.gather(*(
+                    loop.run_in_executor(executor, hash_password, user["password"])
+                    for user in batch
+                ))
+                hash_time += time.perf_counter() - t0
+                hashed_count += len(hashes)
+
+                # Un solo INSERT multi-fila por lote; ON CONFLICT cubre el
+                # caso de un email creado entre la consulta y el insert
+                t0 = time.perf_counter()
+                statement = insert(User).values([
+                    {
+                        "user_id": uuid6.uuid7(),
+                        "email": user["email"],
+                        "role": user["role"],
+                        "hashed_password": hashed,
+                        "is_active": user["is_active"]
+                    }
+                    for user, hashed in zip(batch, hashes)
+                ]).on_conflict_do_nothing(index_elements=["email"])
+                result = await session.execute(statement)
+                await session.commit()
+                insert_time += time.perf_counter() - t0
+
+                inserted += result.rowcount
+                skipped += len(batch) - result.rowcount
+                logger.info(f"Lote {start // batch_size + 1}: {result.rowcount} insertados")
+
+    logger.info(f"Insertados: {inserted}  Omitidos (ya existian): {skipped}")
+    if hash_time:
+        logger.info(f"Hashing: {hashed_count / hash_time:.1f} hashes/s en {hash_time:.1f} s")
+    if insert_time:
+        logger.info(f"Insert: {inserted / insert_time:.0f} filas/s en {insert_time:.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Alta masiva de usuarios desde un CSV")
+    parser.add_argument("csv_path", help="CSV con columnas email,password[,role,is_active]")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help=f"Filas por INSERT (maximo {MAX_BATCH_SIZE})"
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    asyncio.run(provision(args.csv_path, args.batch_size, args.workers))
+    logger.info(f"Tiempo total: {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
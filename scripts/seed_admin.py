@@ -6,8 +6,7 @@ from dotenv import load_dotenv
 
 from app.core.db import AsyncSessionLocal
 from app.modules.auth.models import User
-from app.core.security import hash_password
-from fastapi.concurrency import run_in_threadpool
+from app.core.security import hash_password_async
 
 load_dotenv()
 admin_email = os.getenv("FIRST_SUPERUSER_EMAIL")
@@ -37,7 +36,7 @@ async def create_superuser():
             new_admin = User(
                 email=admin_email,
                 role="admin",
-                hashed_password= await run_in_threadpool(hash_password, admin_pass),
+                hashed_password= await hash_password_async(admin_pass),
                 is_active=True
             )
 
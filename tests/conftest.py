@@ -12,8 +12,9 @@ from slugify import slugify
 
 
 from app.main import app
-from app.core.db import get_db 
+from app.core.db import get_db, get_read_db
 from app.core.security import hash_password, create_access_token
+from app.modules.auth import throttle as login_throttle
 from app.modules.auth.models import User
 from app.modules.catalog.models import Category, Brand, Product, ProductVariant
 from app.modules.catalog.service import _generate_sku
@@ -75,6 +76,10 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
 
     # Intercepta la dependencia
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+
+    # Cada test empieza con los buckets del login vacios
+    login_throttle.reset()
 
     # Crea el cliente HTTP asíncrono
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
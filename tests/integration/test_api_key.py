@@ -0,0 +1,92 @@
+import pytest
+from app.core.security import generate_api_key, hash_api_key
+from app.modules.auth.models import ApiKey
+
+
+@pytest.fixture
+async def api_key_factory(db_session):
+    async def _create_api_key(
+        name: str = "stock-sync",
+        scopes: str = "catalog:write",
+        is_active: bool = True
+    ) -> tuple[str, ApiKey]:
+        api_key = generate_api_key()
+        stored = ApiKey(
+            name=name,
+            key_prefix=api_key[:12],
+            key_digest=hash_api_key(api_key),
+            scopes=scopes,
+            is_active=is_active
+        )
+        db_session.add(stored)
+        await db_session.commit()
+        return api_key, stored
+
+    return _create_api_key
+
+
+#Una integracion con scope catalog:write escribe sin JWT
+async def test_api_key_can_write_catalog(client, api_key_factory):
+    api_key, _ = await api_key_factory()
+
+    response = await client.post(
+        "/catalog/categories/",
+        json={"name": "Procesador", "code": "cpu"},
+        headers={"X-API-Key": api_key}
+    )
+
+    assert response.status_code == 201
+
+
+@pytest.mark.parametrize("scopes, is_active, expected_status", [
+    ("catalog:write", False, 401),
+    ("stock:read", True, 403),
+])
+async def test_api_key_rejected(client, api_key_factory, scopes, is_active, expected_status):
+    api_key, _ = await api_key_factory(scopes=scopes, is_active=is_active)
+
+    response = await client.post(
+        "/catalog/categories/",
+        json={"name": "Procesador", "code": "cpu"},
+        headers={"X-API-Key": api_key}
+    )
+
+    assert response.status_code == expected_status
+
+
+async def test_unknown_api_key(client):
+    response = await client.post(
+        "/catalog/categories/",
+        json={"name": "Procesador", "code": "cpu"},
+        headers={"X-API-Key": generate_api_key()}
+    )
+
+    assert response.status_code == 401
+
+
+#Desactivar la clave la saca del cache
+async def test_deactivated_api_key_stops_working(client, api_key_factory, db_session):
+    api_key, stored = await api_key_factory()
+    response = await client.post(
+        "/catalog/categories/",
+        json={"name": "Procesador", "code": "cpu"},
+        headers={"X-API-Key": api_key}
+    )
+    assert response.status_code == 201
+
+    stored.is_active = False
+    db_session.add(stored)
+    await db_session.commit()
+
+    response = await client.post(
+        "/catalog/categories/",
+        json={"name": "Memoria RAM", "code": "ram"},
+        headers={"X-API-Key": api_key}
+    )
+    assert response.status_code == 401
+
+
+async def test_write_without_credentials(client):
+    response = await client.post("/catalog/categories/", json={"name": "Procesador", "code": "cpu"})
+
+    assert response.status_code == 401
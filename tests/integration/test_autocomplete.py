@@ -0,0 +1,107 @@
+import pytest
+from app.modules.catalog.autocomplete import autocomplete_index
+
+
+@pytest.fixture(autouse=True)
+def clear_autocomplete_index():
+    autocomplete_index.clear()
+    yield
+    autocomplete_index.clear()
+
+
+#El indice se carga desde la BD y el endpoint responde desde memoria
+async def test_autocomplete_from_index(
+    user_client,
+    db_session,
+    brand_factory,
+    category_factory,
+    product_factory
+):
+    category = await category_factory(name="Tarjeta gráfica", code="gpu")
+    brand = await brand_factory(name="zotac", code="zot")
+    await product_factory(name="Zotac RTX 4070", category=category, brand=brand)
+    await product_factory(name="Zotac RTX 3060", category=category, brand=brand, is_active=False)
+
+    await autocomplete_index.sync(db_session)
+    response = await user_client.get("/catalog/autocomplete", params={"q": "zot"})
+
+    assert response.status_code == 200
+    assert response.json() == [
+        {"term": "zotac", "kind": "brand"},
+        {"term": "Zotac RTX 4070", "kind": "product"},
+    ]
+
+    response = await user_client.get("/catalog/autocomplete", params={"q": "grafica"})
+    assert response.json() == [{"term": "Tarjeta gráfica", "kind": "category"}]
+
+
+#El sync incremental recoge filas nuevas y desactivadas
+async def test_autocomplete_incremental_sync(
+    admin_client,
+    db_session,
+    brand_factory
+):
+    brand = await brand_factory(name="Noctua", code="noc")
+    await autocomplete_index.sync(db_session)
+
+    response = await admin_client.patch(f"/catalog/brands/{brand.brand_id}", json={"is_active": False})
+    assert response.status_code == 200
+    await brand_factory(name="Corsair", code="cor")
+    await autocomplete_index.sync(db_session)
+
+    assert autocomplete_index.search("noc", 10) == []
+    assert autocomplete_index.search("cor", 10) == [{"term": "Corsair", "kind": "brand"}]
+
+
+#Un producto o SKU no se sugiere si algun padre esta inactivo
+async def test_autocomplete_requires_active_parents(
+    db_session,
+    brand_factory,
+    category_factory,
+    product_factory,
+    variant_factory
+):
+    category = await category_factory(name="Procesador", code="cpu")
+    hidden_brand = await brand_factory(name="Cyrix", code="cyx", is_active=False)
+    await product_factory(name="Cyrix 6x86", category=category, brand=hidden_brand)
+    brand = await brand_factory(name="amd", code="amd")
+    old_product = await product_factory(name="Athlon viejo", category=category, brand=brand, is_active=False)
+    variant = await variant_factory(product=old_product)
+
+    await autocomplete_index.sync(db_session)
+
+    assert autocomplete_index.search("cyrix", 10) == []
+    assert autocomplete_index.search("athlon", 10) == []
+    assert autocomplete_index.search(variant.sku, 10) == []
+
+
+#Desactivar o reactivar la marca saca o devuelve sus productos y SKUs
+async def test_autocomplete_sync_follows_parent_changes(
+    admin_client,
+    db_session,
+    brand_factory,
+    product_factory,
+    variant_factory
+):
+    brand = await brand_factory(name="zotac", code="zot")
+    product = await product_factory(name="Zotac RTX 4070", brand=brand)
+    variant = await variant_factory(product=product)
+    await autocomplete_index.sync(db_session)
+    assert autocomplete_index.search(variant.sku, 10) == [{"term": variant.sku, "kind": "sku"}]
+
+    response = await admin_client.patch(f"/catalog/brands/{brand.brand_id}", json={"is_active": False})
+    assert response.status_code == 200
+    await autocomplete_index.sync(db_session)
+
+    assert autocomplete_index.search("rtx", 10) == []
+    assert autocomplete_index.search(variant.sku, 10) == []
+
+    response = await admin_client.patch(f"/catalog/brands/{brand.brand_id}", json={"is_active": True})
+    assert response.status_code == 200
+    await autocomplete_index.sync(db_session)
+
+    # El SKU tambien contiene "rtx": vuelven los dos
+    assert autocomplete_index.search("rtx", 10) == [
+        {"term": "Zotac RTX 4070", "kind": "product"},
+        {"term": variant.sku, "kind": "sku"},
+    ]
@@ -22,6 +22,21 @@ async def test_create_category_ok(
     assert "category_id" in data
 
 
+#Sin replica configurada no hace falta la marca read-your-writes
+async def test_create_category_without_replica_sets_no_cookie(
+    admin_client
+):
+    payload = {
+        "name": "Memoria RAM",
+        "code": "ram"
+    }
+
+    response = await admin_client.post("/catalog/categories/", json=payload)
+
+    assert response.status_code == 201
+    assert "set-cookie" not in response.headers
+
+
 #Comprobar paginación y que siendo admin se vean todas las categorías incluso las inactivas
 async def test_list_categories_admin_ok(
     admin_client,
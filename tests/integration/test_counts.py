@@ -0,0 +1,92 @@
+import pytest
+from sqlalchemy import text
+from app.core.config import settings
+from app.core.counting import count_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_count_cache():
+    count_cache.clear()
+
+
+#Total exacto con filtros; sin ?count no hay cabecera
+async def test_products_exact_total_count(
+    user_client,
+    brand_factory,
+    category_factory,
+    product_factory
+):
+    brand = await brand_factory(name="intel", code="int")
+    category = await category_factory(name="Procesador", code="cpu")
+    for i in range(3):
+        await product_factory(name=f"Core i{i}", category=category, brand=brand)
+    await product_factory(name="Core viejo", category=category, brand=brand, is_active=False)
+
+    response = await user_client.get("/catalog/products/?limit=1")
+    assert "X-Total-Count" not in response.headers
+
+    response = await user_client.get("/catalog/products/?limit=1&count=exact")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert response.headers["X-Total-Count"] == "3"
+    assert response.headers["X-Total-Count-Kind"] == "exact"
+
+    response = await user_client.get(f"/catalog/products/?limit=1&count=exact&search=i1&brand_id={brand.brand_id}")
+    assert response.headers["X-Total-Count"] == "1"
+
+
+#Sin filtros (admin sin ?is_active) el estimado es reltuples de pg_class
+async def test_unfiltered_estimate_reads_reltuples(admin_client, db_session, brand_factory):
+    for i in range(3):
+        await brand_factory(name=f"marca {i}", code=f"m{i}")
+    await db_session.execute(text("ANALYZE brand"))
+    reltuples = (await db_session.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'brand'::regclass")
+    )).scalar_one()
+
+    response = await admin_client.get("/catalog/brands/?count=estimate")
+
+    assert response.status_code == 200
+    assert int(response.headers["X-Total-Count"]) == reltuples
+    assert response.headers["X-Total-Count-Kind"] == "estimate"
+
+
+#Con filtros y pocas filas esperadas se cuenta de verdad: la cabecera lo dice
+@pytest.mark.parametrize("endpoint", ["/catalog/categories/", "/catalog/brands/", "/catalog/products/"])
+async def test_small_filtered_estimate_is_exact(user_client, category_factory, endpoint):
+    await category_factory(name="Procesador", code="cpu")
+
+    response = await user_client.get(f"{endpoint}?count=estimate")
+
+    assert response.status_code == 200
+    assert int(response.headers["X-Total-Count"]) == (1 if endpoint == "/catalog/categories/" else 0)
+    assert response.headers["X-Total-Count-Kind"] == "exact"
+
+
+#Por encima del umbral se usa el EXPLAIN, que con estadisticas queda cerca
+async def test_filtered_estimate_stays_close(user_client, db_session, brand_factory, monkeypatch):
+    monkeypatch.setattr(settings, "count_estimate_min_rows", 0)
+    for i in range(20):
+        await brand_factory(name=f"marca {i}", code=f"m{i}")
+    await brand_factory(name="marca vieja", code="mv", is_active=False)
+    await db_session.execute(text("ANALYZE brand"))
+
+    response = await user_client.get("/catalog/brands/?count=estimate")
+
+    assert response.headers["X-Total-Count-Kind"] == "estimate"
+    assert 10 <= int(response.headers["X-Total-Count"]) <= 40
+
+
+async def test_variants_exact_total_count(user_client, variant_factory, product_factory):
+    product = await product_factory(name="Core i9")
+    await variant_factory(product=product)
+
+    response = await user_client.get(f"/catalog/products/{product.product_id}/variants?count=exact")
+
+    assert response.headers["X-Total-Count"] == "1"
+
+
+async def test_invalid_count_mode(user_client):
+    response = await user_client.get("/catalog/categories/?count=maybe")
+
+    assert response.status_code == 422
@@ -0,0 +1,85 @@
+import pytest
+from app.core.config import settings
+
+
+@pytest.fixture
+def fast_path(monkeypatch):
+    monkeypatch.setattr(settings, "catalog_fast_path", True)
+
+
+async def get_both_ways(client, monkeypatch, url):
+    """Pide la misma URL por el camino ORM y por el camino rapido"""
+    monkeypatch.setattr(settings, "catalog_fast_path", False)
+    orm_response = await client.get(url)
+
+    monkeypatch.setattr(settings, "catalog_fast_path", True)
+    fast_response = await client.get(url)
+
+    return orm_response, fast_response
+
+
+#El camino rapido responde exactamente lo mismo que el ORM
+async def test_fast_path_get_product_matches_orm(
+    user_client,
+    product_factory,
+    monkeypatch
+):
+    product = await product_factory(name="Gaming GeForce RTX 4070 Twin Edge")
+
+    orm_response, fast_response = await get_both_ways(
+        user_client, monkeypatch, f"/catalog/products/{product.product_id}"
+    )
+
+    assert fast_response.status_code == 200
+    assert fast_response.json() == orm_response.json()
+
+
+async def test_fast_path_list_products_matches_orm(
+    admin_client,
+    product_factory,
+    brand_factory,
+    category_factory,
+    monkeypatch
+):
+    brand = await brand_factory(name="asus", code="asu")
+    category = await category_factory(name="tarjeta de video", code="gpu")
+    await product_factory(name="Asus 4070", brand=brand, category=category)
+    await product_factory(name="Asus 4080", brand=brand, category=category, is_active=False)
+    await product_factory(name="Asus 4090", brand=brand, category=category)
+
+    for url in ("/catalog/products/", "/catalog/products/?is_active=false"):
+        orm_response, fast_response = await get_both_ways(admin_client, monkeypatch, url)
+
+        assert fast_response.status_code == 200
+        # Dentro de la transaccion del test todos comparten created_at,
+        # por lo que solo se compara el contenido y no el orden
+        fast_data = sorted(fast_response.json(), key=lambda p: p["product_id"])
+        orm_data = sorted(orm_response.json(), key=lambda p: p["product_id"])
+        assert fast_data == orm_data
+
+
+async def test_fast_path_get_variant_matches_orm(
+    user_client,
+    variant_factory,
+    monkeypatch
+):
+    variant = await variant_factory(attributes="White Edition, 8GB VRAM")
+
+    orm_response, fast_response = await get_both_ways(
+        user_client, monkeypatch, f"/catalog/variants/{variant.variant_id}"
+    )
+
+    assert fast_response.status_code == 200
+    assert fast_response.json() == orm_response.json()
+
+
+async def test_fast_path_hides_inactive_product_from_guests(
+    user_client,
+    product_factory,
+    fast_path
+):
+    product = await product_factory(name="Core i9-14900K", is_active=False)
+
+    response = await user_client.get(f"/catalog/products/{product.product_id}")
+
+    assert response.status_code == 404
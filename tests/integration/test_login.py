@@ -1,6 +1,8 @@
 import pytest
 import jwt
+from pwdlib.hashers.argon2 import Argon2Hasher
 from app.core.config import settings
+from app.core.security import password_hash
 
 
 
@@ -71,3 +73,45 @@ async def test_login_failures(
     assert response.status_code == 401
 
 
+
+
+
+"""
+Edge case. Muchos intentos contra el mismo email se cortan con 429
+antes de verificar la contraseña.
+"""
+async def test_login_throttled_by_email(client, user_factory):
+    await user_factory(email="client_login@begamer.com", password="password_real")
+    payload = {"email": "client_login@begamer.com", "password": "CLAVE_MALA"}
+
+    for _ in range(settings.login_email_burst):
+        response = await client.post("/auth/login", json=payload)
+        assert response.status_code == 401
+
+    response = await client.post("/auth/login", json=payload)
+
+    assert response.status_code == 429
+    assert "Retry-After" in response.headers
+
+
+
+"""
+Un hash con parametros de Argon2 viejos se reemplaza en el login exitoso.
+"""
+async def test_login_rehashes_outdated_password(client, user_factory, db_session):
+    data = await user_factory(email="rehash@begamer.com", password="password_real")
+    user = data["user"]
+    user.hashed_password = Argon2Hasher(time_cost=1, memory_cost=8192, parallelism=1).hash("password_real")
+    db_session.add(user)
+    await db_session.commit()
+    old_hash = user.hashed_password
+
+    response = await client.post(
+        "/auth/login",
+        json={"email": "rehash@begamer.com", "password": "password_real"}
+    )
+
+    assert response.status_code == 200
+    await db_session.refresh(user)
+    assert user.hashed_password != old_hash
+    assert not password_hash.current_hasher.check_needs_rehash(user.hashed_password)
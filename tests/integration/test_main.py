@@ -2,4 +2,25 @@ async def test_endpoint_health(client):
     response = await client.get("/health")
 
     assert response.status_code == 200
-    assert response.json() == {"status": "ok"}
\ No newline at end of file
+    assert response.json() == {"status": "ok"}
+
+async def test_endpoint_health_db(admin_client):
+    response = await admin_client.get("/health/db")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["pool"] == "InstrumentedPool"
+    assert "in_use" in data
+    assert "checkout_wait_max_ms" in data
+
+
+async def test_endpoint_health_db_requires_token(client):
+    response = await client.get("/health/db")
+
+    assert response.status_code == 401
+
+
+async def test_endpoint_health_db_requires_admin(user_client):
+    response = await user_client.get("/health/db")
+
+    assert response.status_code == 403
@@ -0,0 +1,58 @@
+from app.modules.auth.cache import principal_cache
+
+
+#La segunda peticion del mismo usuario no vuelve a consultar la BD
+async def test_authenticated_user_is_cached(
+    admin_client,
+    admin_user
+):
+    principal_cache.invalidate(admin_user.user_id)
+
+    response = await admin_client.post("/catalog/categories/", json={"name": "Procesador", "code": "cpu"})
+
+    assert response.status_code == 201
+    cached = principal_cache.get(admin_user.user_id)
+    assert cached is not None
+    assert cached.role == "admin"
+
+
+#Un cambio en la fila del usuario invalida su copia cacheada
+async def test_user_update_invalidates_cache(
+    admin_client,
+    admin_user,
+    db_session
+):
+    response = await admin_client.post("/catalog/categories/", json={"name": "Procesador", "code": "cpu"})
+    assert response.status_code == 201
+    assert principal_cache.get(admin_user.user_id) is not None
+
+    admin_user.role = "client"
+    db_session.add(admin_user)
+    await db_session.commit()
+
+    assert principal_cache.get(admin_user.user_id) is None
+
+    response = await admin_client.post("/catalog/categories/", json={"name": "Memoria RAM", "code": "ram"})
+    assert response.status_code == 403
+
+
+#La copia se invalida al confirmar, no en el flush, y no guarda el hash del password
+async def test_cache_invalidated_on_commit_only(
+    admin_client,
+    admin_user,
+    db_session
+):
+    response = await admin_client.post("/catalog/categories/", json={"name": "Procesador", "code": "cpu"})
+    assert response.status_code == 201
+    assert not hasattr(principal_cache.get(admin_user.user_id), "hashed_password")
+
+    admin_user.is_active = False
+    db_session.add(admin_user)
+    await db_session.flush()
+    assert principal_cache.get(admin_user.user_id) is not None
+
+    await db_session.commit()
+    assert principal_cache.get(admin_user.user_id) is None
+
+    response = await admin_client.post("/catalog/categories/", json={"name": "Memoria RAM", "code": "ram"})
+    assert response.status_code == 401
@@ -382,3 +382,160 @@ async def test_product_permissions_for_client(
         endpoint
     )
     assert response.status_code == 403
+
+
+#Recorrer el listado con cursor: sin repetidos ni huecos y sin X-Next-Cursor al final
+async def test_list_products_cursor_pagination(
+    user_client,
+    brand_factory,
+    category_factory,
+    product_factory
+):
+    brand = await brand_factory(name="intel", code="int")
+    category = await category_factory(name="Procesador", code="cpu")
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i in range(5):
+        await product_factory(
+            name=f"Core i{i}",
+            category=category,
+            brand=brand,
+            created_at=base + timedelta(days=i)
+        )
+
+    seen = []
+    url = "/catalog/products/?limit=2"
+    while True:
+        response = await user_client.get(url)
+        assert response.status_code == 200
+        seen.extend(product["name"] for product in response.json())
+
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        url = f"/catalog/products/?limit=2&cursor={cursor}"
+
+    assert seen == [f"Core i{i}" for i in reversed(range(5))]
+
+
+async def test_list_products_invalid_cursor(user_client):
+    response = await user_client.get("/catalog/products/?cursor=no-es-un-cursor")
+
+    assert response.status_code == 400
+
+
+#Busqueda full-text: sin tildes y con stemming en español
+async def test_search_products_unaccent_and_stemming(
+    user_client,
+    brand_factory,
+    category_factory,
+    product_factory
+):
+    brand = await brand_factory(name="zotac", code="zot")
+    category = await category_factory(name="Componentes", code="cmp")
+    await product_factory(name="Tarjeta gráfica RTX 4070", category=category, brand=brand)
+    await product_factory(
+        name="Gabinete ATX",
+        description="Soporta hasta tres ventiladores",
+        category=category,
+        brand=brand
+    )
+
+    response = await user_client.get("/catalog/products/", params={"search": "graficas"})
+    assert [p["name"] for p in response.json()] == ["Tarjeta gráfica RTX 4070"]
+
+    response = await user_client.get("/catalog/products/", params={"search": "ventilador"})
+    assert [p["name"] for p in response.json()] == ["Gabinete ATX"]
+
+
+#Un match en el nombre rankea por encima de uno en la descripcion, y la marca tambien se indexa
+async def test_search_products_ranked(
+    user_client,
+    brand_factory,
+    category_factory,
+    product_factory
+):
+    category = await category_factory(name="Refrigeracion", code="ref")
+    arctic = await brand_factory(name="Arctic", code="arc")
+    noctua = await brand_factory(name="Noctua", code="noc")
+    await product_factory(
+        name="Pasta termica MX-6",
+        description="Ideal para disipador de torre",
+        category=category,
+        brand=arctic
+    )
+    await product_factory(name="Disipador NH-D15", category=category, brand=noctua)
+
+    response = await user_client.get("/catalog/products/", params={"search": "disipador"})
+    assert [p["name"] for p in response.json()] == ["Disipador NH-D15", "Pasta termica MX-6"]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = await user_client.get("/catalog/products/", params={"search": "noctua"})
+    assert [p["name"] for p in response.json()] == ["Disipador NH-D15"]
+
+
+#Sin resultados full-text se reintenta por similitud (errores de tipeo)
+async def test_search_products_fuzzy_fallback(
+    user_client,
+    brand_factory,
+    category_factory,
+    product_factory
+):
+    category = await category_factory(name="Procesador", code="cpu")
+    amd = await brand_factory(name="AMD", code="amd")
+    intel = await brand_factory(name="intel", code="int")
+    await product_factory(name="Ryzen 7 7800X3D", category=category, brand=amd)
+    await product_factory(name="Core i9-14900K", category=category, brand=intel)
+
+    response = await user_client.get("/catalog/products/", params={"search": "ryzen"})
+    assert "X-Search-Fallback" not in response.headers
+
+    response = await user_client.get("/catalog/products/", params={"search": "ryzem", "count": "exact"})
+    assert response.status_code == 200
+    assert [p["name"] for p in response.json()] == ["Ryzen 7 7800X3D"]
+    assert response.headers["X-Search-Fallback"] == "fuzzy"
+    assert response.headers["X-Total-Count"] == "1"
+
+
+#Sugerencias "quisiste decir" con los terminos conocidos mas parecidos
+async def test_search_suggestions(
+    user_client,
+    brand_factory,
+    category_factory,
+    product_factory
+):
+    category = await category_factory(name="Refrigeracion", code="ref")
+    brand = await brand_factory(name="Noctua", code="noc")
+    await product_factory(name="Disipador NH-D15", category=category, brand=brand)
+
+    response = await user_client.get("/catalog/products/suggestions", params={"search": "noctus"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data[0]["term"] == "Noctua"
+    assert data[0]["kind"] == "brand"
+    assert 0 < data[0]["score"] <= 1
+
+
+#Un SKU activo de un producto inactivo no se sugiere
+async def test_search_suggestions_skip_inactive_product_skus(
+    user_client,
+    brand_factory,
+    category_factory,
+    product_factory,
+    variant_factory
+):
+    category = await category_factory(name="Refrigeracion", code="ref")
+    brand = await brand_factory(name="Noctua", code="noc")
+    product = await product_factory(name="Disipador NH-D15", category=category, brand=brand, is_active=False)
+    variant = await variant_factory(product=product)
+
+    response = await user_client.get("/catalog/products/suggestions", params={"search": variant.sku})
+
+    assert response.status_code == 200
+    assert [row for row in response.json() if row["kind"] == "sku"] == []
+
+
+async def test_search_suggestions_requires_term(user_client):
+    response = await user_client.get("/catalog/products/suggestions")
+
+    assert response.status_code == 422
@@ -0,0 +1,63 @@
+import jwt
+from app.core.config import settings
+
+
+async def login(client, user_factory) -> dict:
+    await user_factory(email="refresh@begamer.com", password="password_real")
+    response = await client.post(
+        "/auth/login",
+        json={"email": "refresh@begamer.com", "password": "password_real"}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+"""
+Happy path. El refresh entrega un access token nuevo y rota el refresh token.
+"""
+async def test_refresh_rotates_token(client, user_factory):
+    tokens = await login(client, user_factory)
+
+    response = await client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+
+    assert response.status_code == 200
+    renewed = response.json()
+    assert renewed["refresh_token"] != tokens["refresh_token"]
+    decoded = jwt.decode(
+        renewed["access_token"],
+        settings.jwt_secret,
+        algorithms=[settings.jwt_alg]
+    )
+    assert decoded["role"] == "client"
+
+
+"""
+Edge case. Reusar un refresh token ya rotado revoca toda la familia,
+incluido el token que se entrego al rotar.
+"""
+async def test_reused_refresh_token_revokes_family(client, user_factory):
+    tokens = await login(client, user_factory)
+    first = await client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert first.status_code == 200
+
+    reuse = await client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert reuse.status_code == 401
+
+    response = await client.post("/auth/refresh", json={"refresh_token": first.json()["refresh_token"]})
+    assert response.status_code == 401
+
+
+async def test_logout_revokes_refresh_token(client, user_factory):
+    tokens = await login(client, user_factory)
+
+    response = await client.post("/auth/logout", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 204
+
+    response = await client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert response.status_code == 401
+
+
+async def test_unknown_refresh_token(client):
+    response = await client.post("/auth/refresh", json={"refresh_token": "no-existe"})
+
+    assert response.status_code == 401
@@ -0,0 +1,77 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from sqlmodel import select
+from app.modules.auth.models import RefreshToken, RevokedToken
+from app.modules.auth.revocation import RevocationList, purge_expired_tokens
+
+
+#Despues del logout el access token deja de servir aunque no haya expirado
+async def test_logout_revokes_access_token(client, user_factory):
+    await user_factory(email="revoke@begamer.com", password="password_real", role="admin")
+    response = await client.post(
+        "/auth/login",
+        json={"email": "revoke@begamer.com", "password": "password_real"}
+    )
+    tokens = response.json()
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    response = await client.post(
+        "/auth/logout",
+        json={"refresh_token": tokens["refresh_token"]},
+        headers=headers
+    )
+    assert response.status_code == 204
+
+    response = await client.post(
+        "/catalog/categories/",
+        json={"name": "Procesador", "code": "cpu"},
+        headers=headers
+    )
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Revoked token"
+
+
+#Otro worker ve la revocacion en su siguiente sync incremental
+async def test_sync_loads_revocations_from_db(db_session):
+    revocations = RevocationList()
+    await revocations.sync(db_session)
+    assert not revocations.is_revoked("jti-de-otro-worker")
+
+    db_session.add(RevokedToken(
+        jti="jti-de-otro-worker",
+        expires_at=datetime.now(timezone.utc) + timedelta(minutes=10)
+    ))
+    await db_session.commit()
+
+    await revocations.sync(db_session)
+    assert revocations.is_revoked("jti-de-otro-worker")
+
+
+#La limpieza periodica borra solo lo que ya paso su expires_at
+async def test_purge_expired_tokens(db_session, user_factory):
+    user = (await user_factory())["user"]
+    now = datetime.now(timezone.utc)
+    db_session.add_all([
+        RefreshToken(
+            user_id=user.user_id,
+            family_id=uuid.uuid4(),
+            token_hash="vencido",
+            expires_at=now - timedelta(days=1)
+        ),
+        RefreshToken(
+            user_id=user.user_id,
+            family_id=uuid.uuid4(),
+            token_hash="vigente",
+            expires_at=now + timedelta(days=1)
+        ),
+        RevokedToken(jti="jti-vencido", expires_at=now - timedelta(minutes=1)),
+        RevokedToken(jti="jti-vigente", expires_at=now + timedelta(minutes=10)),
+    ])
+    await db_session.commit()
+
+    await purge_expired_tokens(db_session, now)
+
+    hashes = (await db_session.exec(select(RefreshToken.token_hash))).all()
+    jtis = (await db_session.exec(select(RevokedToken.jti))).all()
+    assert hashes == ["vigente"]
+    assert jtis == ["jti-vigente"]
@@ -0,0 +1,67 @@
+import uuid6
+import pytest
+from app.core.config import settings
+from app.core.security import create_access_token
+
+
+@pytest.fixture
+def stateless_claims(monkeypatch):
+    monkeypatch.setattr(settings, "auth_stateless_claims", True)
+    monkeypatch.setattr(settings, "jwt_expire_min", 5)
+
+
+def bearer(claims: dict) -> dict:
+    return {"Authorization": f"Bearer {create_access_token(data=claims)}"}
+
+
+#Con tokens de vida corta el rol sale de los claims, sin consultar la BD
+async def test_admin_check_uses_claims(client, stateless_claims):
+    headers = bearer({"sub": str(uuid6.uuid7()), "role": "admin", "is_active": True})
+
+    response = await client.post(
+        "/catalog/categories/",
+        json={"name": "Procesador", "code": "cpu"},
+        headers=headers
+    )
+
+    assert response.status_code == 201
+
+
+async def test_inactive_claim_is_rejected(client, stateless_claims):
+    headers = bearer({"sub": str(uuid6.uuid7()), "role": "admin", "is_active": False})
+
+    response = await client.post(
+        "/catalog/categories/",
+        json={"name": "Procesador", "code": "cpu"},
+        headers=headers
+    )
+
+    assert response.status_code == 401
+
+
+async def test_client_claim_is_forbidden(client, stateless_claims):
+    headers = bearer({"sub": str(uuid6.uuid7()), "role": "client", "is_active": True})
+
+    response = await client.post(
+        "/catalog/categories/",
+        json={"name": "Procesador", "code": "cpu"},
+        headers=headers
+    )
+
+    assert response.status_code == 403
+
+
+#Un token de vida larga no califica y se valida contra la BD
+async def test_long_lived_token_falls_back_to_db(client, monkeypatch):
+    monkeypatch.setattr(settings, "auth_stateless_claims", True)
+    monkeypatch.setattr(settings, "jwt_expire_min", settings.auth_stateless_max_token_min + 60)
+    headers = bearer({"sub": str(uuid6.uuid7()), "role": "admin", "is_active": True})
+
+    response = await client.post(
+        "/catalog/categories/",
+        json={"name": "Procesador", "code": "cpu"},
+        headers=headers
+    )
+
+    assert response.status_code == 401
+    assert response.json()["detail"] == "User not found"
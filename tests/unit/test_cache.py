@@ -0,0 +1,46 @@
+import time
+from app.core.cache import TTLCache
+
+
+def test_cache_returns_stored_value():
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("missing") is None
+
+
+def test_cache_expires_entries(monkeypatch):
+    cache = TTLCache(max_size=10, ttl=60)
+    now = time.monotonic()
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=5)
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 30)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")      # "a" pasa a ser el mas reciente
+    cache.set("c", 3)   # desplaza a "b"
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_cache_invalidate():
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set("a", 1)
+    cache.invalidate("a")
+    cache.invalidate("never-set")
+
+    assert cache.get("a") is None
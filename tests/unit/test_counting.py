@@ -0,0 +1,138 @@
+import pytest
+from sqlalchemy import select
+from fastapi import Response
+from app.core.config import settings
+from app.core.counting import _Explain, count_cache, count_rows, set_total_count
+from app.core.db import _transaction_settings
+from app.modules.catalog.models import Category
+
+
+@pytest.fixture(autouse=True)
+def isolated_transaction_settings():
+    # count_rows registra el perfil reporting en la peticion en curso
+    token = _transaction_settings.set(None)
+    yield
+    _transaction_settings.reset(token)
+
+
+class _Result:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one(self):
+        return self.value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class _Session:
+    def __init__(self, value, reltuples=None, plan_rows=None):
+        self.value = value
+        self.reltuples = reltuples
+        self.plan_rows = plan_rows
+        self.calls = 0
+        self.settings = []
+        self.statements = []
+
+    def in_transaction(self):
+        return True
+
+    async def execute(self, statement, params=None):
+        if "set_config" in str(statement):
+            self.settings.append(params)
+            return _Result(None)
+        if isinstance(statement, _Explain):
+            self.statements.append("explain")
+            return _Result([{"Plan": {"Plan Rows": self.plan_rows}}])
+        if "reltuples" in str(statement):
+            self.statements.append("reltuples")
+            return _Result(self.reltuples)
+        self.statements.append("count")
+        self.calls += 1
+        return _Result(self.value)
+
+
+async def test_exact_count_is_an_int_and_cached():
+    count_cache.clear()
+    session = _Session(3)
+    query = select(Category).where(Category.is_active.is_(True))
+
+    total, kind = await count_rows(session, query, "exact", "category", (True,))
+    assert (total, kind) == (3, "exact")
+    assert type(total) is int
+
+    # Segunda pagina del mismo listado: sale del cache
+    assert await count_rows(session, query, "exact", "category", (True,)) == (3, "exact")
+    assert session.calls == 1
+
+
+async def test_exact_count_uses_reporting_profile():
+    count_cache.clear()
+    session = _Session(7)
+    await count_rows(session, select(Category), "exact", "category", ("reporting",))
+
+    # La transaccion ya estaba abierta: set_config inmediato con work_mem
+    assert session.settings == [{"name_0": "work_mem", "value_0": settings.db_reporting_work_mem}]
+    assert _transaction_settings.get()["work_mem"] == settings.db_reporting_work_mem
+
+
+async def test_unfiltered_estimate_reads_reltuples():
+    count_cache.clear()
+    session = _Session(3, reltuples=120000)
+
+    counted = await count_rows(session, select(Category), "estimate", "category", (None,))
+
+    assert counted == (120000, "estimate")
+    assert session.statements == ["reltuples"]
+
+
+async def test_unanalyzed_table_counts_exactly():
+    count_cache.clear()
+    session = _Session(3, reltuples=-1)
+
+    counted = await count_rows(session, select(Category), "estimate", "category", (None,))
+
+    assert counted == (3, "exact")
+    assert session.statements == ["reltuples", "count"]
+
+
+async def test_small_filtered_estimate_counts_exactly():
+    count_cache.clear()
+    # El planner espera 325 filas para un filtro que deja una sola
+    session = _Session(1, plan_rows=325)
+    query = select(Category).where(Category.is_active.is_(True))
+
+    counted = await count_rows(session, query, "estimate", "category", (True,))
+
+    assert counted == (1, "exact")
+    assert session.statements == ["explain", "count"]
+
+
+async def test_large_filtered_estimate_uses_the_planner(monkeypatch):
+    count_cache.clear()
+    monkeypatch.setattr(settings, "count_estimate_min_rows", 1000)
+    session = _Session(1, plan_rows=50000)
+    query = select(Category).where(Category.is_active.is_(True))
+
+    counted = await count_rows(session, query, "estimate", "category", (True,))
+
+    assert counted == (50000, "estimate")
+    assert session.statements == ["explain"]
+
+
+def test_explain_keeps_bound_parameters():
+    query = select(Category).where(Category.name == "Procesador: 'AMD'")
+    compiled = _Explain(query).compile()
+
+    assert str(compiled).startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "AMD" not in str(compiled)
+    assert "Procesador: 'AMD'" in compiled.params.values()
+
+
+def test_total_count_headers():
+    response = Response()
+    set_total_count(response, 3, "exact")
+
+    assert response.headers["X-Total-Count"] == "3"
+    assert response.headers["X-Total-Count-Kind"] == "exact"
@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+import uuid6
+from app.modules.catalog.repository.fast_repo import ProductRecord, VariantRecord
+from app.modules.catalog.schemas import ProductRead, ProductVariantRead
+
+NOW = datetime.now(timezone.utc)
+
+
+def test_product_record_validates_as_product_read():
+    product_id, category_id, brand_id = uuid6.uuid7(), uuid6.uuid7(), uuid6.uuid7()
+    row = (
+        product_id, "Asus 4070", "gpu-asus-4070", "Tarjeta de video", category_id, brand_id,
+        True, NOW, NOW,
+        "tarjeta de video", "GPU", True, NOW, NOW,
+        "asus", "ASU", True, NOW, NOW,
+    )
+
+    # FastAPI valida el response_model desde atributos, igual que con el ORM
+    product = ProductRead.model_validate(ProductRecord(row), from_attributes=True)
+
+    assert product.product_id == product_id
+    assert product.category.category_id == category_id
+    assert product.category.code == "GPU"
+    assert product.brand.brand_id == brand_id
+    assert product.brand.name == "asus"
+
+
+def test_variant_record_validates_as_variant_read():
+    variant_id, product_id = uuid6.uuid7(), uuid6.uuid7()
+    row = (
+        variant_id, product_id, "GPU-ASU-ASUS-4070-8GB", Decimal("499.99"), 3, "8GB",
+        True, NOW, NOW,
+        "Asus 4070", "gpu-asus-4070", "tarjeta de video", "GPU", "asus", "ASU",
+    )
+
+    variant = ProductVariantRead.model_validate(VariantRecord(row), from_attributes=True)
+
+    assert variant.variant_id == variant_id
+    assert variant.price == Decimal("499.99")
+    assert variant.product.product_id == product_id
+    assert variant.product.category.code == "GPU"
+    assert variant.product.brand.code == "ASU"
@@ -0,0 +1,94 @@
+import asyncio
+from app.core.db import _write_marker
+from app.core.middleware import CancelOnDisconnectMiddleware, ReadYourWritesMiddleware
+
+
+def make_scope(method: str = "GET") -> dict:
+    return {"type": "http", "method": method, "path": "/catalog/products/", "headers": []}
+
+
+async def test_cancels_request_when_client_disconnects():
+    cancelled = asyncio.Event()
+
+    async def slow_app(scope, receive, send):
+        try:
+            await asyncio.sleep(10)  # consulta larga
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = CancelOnDisconnectMiddleware(slow_app)
+    await asyncio.wait_for(middleware(make_scope(), receive, send), timeout=1)
+
+    assert cancelled.is_set()
+    assert sent == []
+
+
+async def test_completes_request_when_client_stays():
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    async def receive():
+        await asyncio.sleep(10)  # el cliente sigue conectado
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = CancelOnDisconnectMiddleware(app)
+    await asyncio.wait_for(middleware(make_scope(), receive, send), timeout=1)
+
+    assert [message["type"] for message in sent] == ["http.response.start", "http.response.body"]
+
+
+async def test_does_not_cancel_writes():
+    finished = asyncio.Event()
+
+    async def app(scope, receive, send):
+        await asyncio.sleep(0.05)
+        finished.set()
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        pass
+
+    middleware = CancelOnDisconnectMiddleware(app)
+    await middleware(make_scope("POST"), receive, send)
+
+    assert finished.is_set()
+
+
+def _app_that_writes(wrote: bool):
+    async def app(scope, receive, send):
+        if wrote:
+            # Lo que hace el after_flush de la sesion al escribir
+            _write_marker.get().wrote = True
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+    return app
+
+
+async def test_write_sets_read_your_writes_cookie():
+    for wrote, expected in ((True, True), (False, False)):
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        middleware = ReadYourWritesMiddleware(_app_that_writes(wrote))
+        await middleware(make_scope("POST"), None, send)
+
+        headers = dict(sent[0]["headers"])
+        assert (b"set-cookie" in headers) is expected
@@ -0,0 +1,29 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+import pytest
+from app.core.pagination import encode_cursor, decode_cursor, next_cursor, InvalidCursorError
+
+
+def test_cursor_roundtrip():
+    created_at = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    item_id = uuid.uuid4()
+
+    assert decode_cursor(encode_cursor(created_at, item_id)) == (created_at, item_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "no-es-un-cursor", "WyJ4Il0"])
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def test_next_cursor_only_on_full_pages():
+    items = [
+        SimpleNamespace(created_at=datetime.now(timezone.utc), product_id=uuid.uuid4())
+        for _ in range(2)
+    ]
+
+    assert next_cursor(items, 3, "product_id") is None
+    assert next_cursor([], 0, "product_id") is None
+    assert decode_cursor(next_cursor(items, 2, "product_id")) == (items[1].created_at, items[1].product_id)
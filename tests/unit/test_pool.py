@@ -0,0 +1,41 @@
+from unittest.mock import MagicMock
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+from app.core.pool import InstrumentedPool, pool_stats
+
+
+def make_pool() -> InstrumentedPool:
+    return InstrumentedPool(lambda: MagicMock(), pool_size=1, max_overflow=1, timeout=0.01)
+
+
+def test_pool_stats_counts_checkouts_and_overflow():
+    pool = make_pool()
+
+    first = pool.connect()
+    second = pool.connect()  # supera pool_size, abre overflow
+
+    stats = pool_stats(pool)
+    assert stats["checkouts"] == 2
+    assert stats["in_use"] == 2
+    assert stats["overflow_events"] == 1
+
+    first.close()
+    second.close()
+
+    stats = pool_stats(pool)
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 1
+
+
+async def test_pool_stats_counts_timeouts():
+    pool = make_pool()
+    conns = [pool.connect(), pool.connect()]
+
+    # El checkout bloqueante del pool asincrono necesita correr dentro de un greenlet
+    with pytest.raises(exc.TimeoutError):
+        await greenlet_spawn(pool.connect)
+
+    assert pool_stats(pool)["timeouts"] == 1
+    for conn in conns:
+        conn.close()
@@ -0,0 +1,64 @@
+import uuid
+from app.modules.catalog.autocomplete import PrefixIndex, normalize
+
+
+def _index() -> PrefixIndex:
+    index = PrefixIndex()
+    index.replace_all([
+        ("product", 1, "Gaming GeForce RTX 4070"),
+        ("product", 2, "Ryzen 7 7800X3D"),
+        ("brand", 3, "Noctua"),
+        ("category", 4, "Tarjeta gráfica"),
+        ("sku", 5, "GPU-ZOT-RTX-4070-OC"),
+    ])
+    return index
+
+
+def test_normalize_folds_case_accents_and_dashes():
+    assert normalize("  Tarjeta  GRÁFICA ") == "tarjeta grafica"
+    assert normalize("GPU-ZOT-RTX") == "gpu zot rtx"
+
+
+def test_prefix_matches_any_word_start():
+    index = _index()
+
+    assert index.search("rtx 40", 10) == [
+        {"term": "Gaming GeForce RTX 4070", "kind": "product"},
+        {"term": "GPU-ZOT-RTX-4070-OC", "kind": "sku"},
+    ]
+    assert index.search("grafi", 10) == [{"term": "Tarjeta gráfica", "kind": "category"}]
+    assert index.search("noc", 10) == [{"term": "Noctua", "kind": "brand"}]
+    assert index.search("xyz", 10) == []
+    assert index.search("   ", 10) == []
+
+
+def test_search_respects_limit():
+    index = _index()
+
+    assert len(index.search("g", 1)) == 1
+
+
+def test_upsert_and_remove_are_incremental():
+    index = _index()
+    brand_id = uuid.uuid4()
+
+    index.upsert("brand", brand_id, "Corsair")
+    assert index.search("cors", 10) == [{"term": "Corsair", "kind": "brand"}]
+
+    # Renombrar reemplaza las claves del termino anterior
+    index.upsert("brand", brand_id, "Corsair Gaming")
+    assert index.search("gaming", 10) == [
+        {"term": "Corsair Gaming", "kind": "brand"},
+        {"term": "Gaming GeForce RTX 4070", "kind": "product"},
+    ]
+
+    # Desactivar lo saca del indice
+    index.upsert("brand", brand_id, "Corsair Gaming", active=False)
+    assert index.search("cors", 10) == []
+
+    index.remove("product", 2)
+    assert index.search("ryzen", 10) == []
+    assert len(index) == 4
+    assert index.stats()["keys"] == sum(len(term.split()) for term in (
+        "Gaming GeForce RTX 4070", "Noctua", "Tarjeta grafica", "GPU ZOT RTX 4070 OC"
+    ))
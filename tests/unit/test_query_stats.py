@@ -0,0 +1,25 @@
+from app.core.query_stats import QueryStats, normalize_statement, REPEATED_QUERY_THRESHOLD
+
+
+def test_normalize_statement_strips_values():
+    statement = """SELECT product.name
+        FROM product
+        WHERE product.product_id = $1::UUID AND product.name = 'Asus 4070' LIMIT 10"""
+
+    assert normalize_statement(statement) == (
+        "SELECT product.name FROM product "
+        "WHERE product.product_id = ?::UUID AND product.name = ? LIMIT ?"
+    )
+
+
+def test_query_stats_detects_repeated_statements():
+    stats = QueryStats()
+    for i in range(REPEATED_QUERY_THRESHOLD):
+        stats.record("SELECT brand.name FROM brand WHERE brand.brand_id = ?", 0.002)
+    stats.record("SELECT product.name FROM product", 0.010)
+
+    assert stats.count == REPEATED_QUERY_THRESHOLD + 1
+    assert stats.max_time == 0.010
+    assert stats.repeated_statements() == [
+        ("SELECT brand.name FROM brand WHERE brand.brand_id = ?", REPEATED_QUERY_THRESHOLD)
+    ]
@@ -0,0 +1,61 @@
+import time
+from app.core.rate_limit import TokenBucketLimiter, InFlightLimit
+
+
+def test_bucket_allows_burst_then_rejects():
+    limiter = TokenBucketLimiter(rate_per_minute=60, burst=3, max_keys=10)
+
+    assert [limiter.allow("1.2.3.4") for _ in range(4)] == [True, True, True, False]
+    assert limiter.allow("5.6.7.8")
+    assert limiter.retry_after("1.2.3.4") >= 1
+
+
+def test_bucket_refills_over_time(monkeypatch):
+    limiter = TokenBucketLimiter(rate_per_minute=60, burst=1, max_keys=10)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+
+    assert limiter.allow("a")
+    assert not limiter.allow("a")
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 1.5)
+    assert limiter.allow("a")
+
+
+def test_bucket_memory_is_bounded():
+    limiter = TokenBucketLimiter(rate_per_minute=60, burst=1, max_keys=100)
+
+    for i in range(10_000):
+        limiter.allow(f"ip-{i}")
+
+    assert len(limiter) == 100
+
+
+def test_full_map_fails_closed_instead_of_evicting(monkeypatch):
+    limiter = TokenBucketLimiter(rate_per_minute=60, burst=1, max_keys=3)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+
+    assert limiter.allow("victima@x.com")
+    assert not limiter.allow("victima@x.com")
+
+    # Rotar claves no desaloja el bucket agotado: las nuevas se rechazan
+    assert limiter.allow("a")
+    assert limiter.allow("b")
+    assert not limiter.allow("c")
+    assert not limiter.allow("victima@x.com")
+    assert limiter.retry_after("c") >= 1
+
+    # Cuando los buckets se recargan se liberan los lugares
+    monkeypatch.setattr(time, "monotonic", lambda: now + 1.5)
+    assert limiter.allow("c")
+    assert len(limiter) == 1
+
+
+def test_in_flight_limit():
+    limit = InFlightLimit(1)
+
+    assert limit.acquire()
+    assert not limit.acquire()
+    limit.release()
+    assert limit.acquire()
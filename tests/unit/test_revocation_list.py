@@ -0,0 +1,26 @@
+import time
+from datetime import datetime, timedelta, timezone
+from app.modules.auth.revocation import RevocationList
+
+
+def test_revoked_jti_is_found():
+    revocations = RevocationList()
+    revocations.add("abc", datetime.now(timezone.utc) + timedelta(minutes=5))
+
+    assert revocations.is_revoked("abc")
+    assert not revocations.is_revoked("otro")
+    assert not revocations.is_revoked(None)
+
+
+def test_expired_revocations_are_pruned(monkeypatch):
+    revocations = RevocationList()
+    now = datetime.now(timezone.utc)
+    revocations.add("viejo", now + timedelta(minutes=1))
+    revocations.add("nuevo", now + timedelta(minutes=30))
+
+    monkeypatch.setattr(time, "time", lambda: (now + timedelta(minutes=2)).timestamp())
+    revocations._prune()
+
+    assert not revocations.is_revoked("viejo")
+    assert revocations.is_revoked("nuevo")
+    assert len(revocations) == 1
@@ -1,4 +1,23 @@
+import asyncio
+import hashlib
+import threading
+import time
+import pytest
 from app.core.security import hash_password, verify_password, create_access_token
+from app.core.security import (
+    PasswordHasherPool,
+    PasswordHasherBusyError,
+    hash_password_async,
+    verify_password_async,
+    generate_refresh_token,
+    hash_refresh_token,
+    verify_and_update_password,
+    password_hash,
+    decode_access_token,
+    generate_api_key,
+    hash_api_key
+)
+from pwdlib.hashers.argon2 import Argon2Hasher
 import jwt
 from app.core.config import settings
 
@@ -19,4 +38,129 @@ def test_create_access_token():
 
     payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_alg])
     assert payload["sub"] == "usuario@test.com"
-    assert "exp" in payload
\ No newline at end of file
+    assert "exp" in payload
+
+def test_access_token_has_issued_at():
+    token = create_access_token({"sub": "usuario@test.com"})
+
+    payload = jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_alg])
+    assert payload["iat"] < payload["exp"]
+
+
+async def test_password_hasher_runs_on_dedicated_executor():
+    pool = PasswordHasherPool(workers=1, max_queue=0)
+    try:
+        thread_name = await pool.run(lambda: threading.current_thread().name)
+    finally:
+        pool.shutdown()
+
+    assert thread_name.startswith("argon2")
+    assert pool.stats()["completed"] == 1
+
+
+async def test_password_hasher_rejects_when_queue_is_full():
+    pool = PasswordHasherPool(workers=1, max_queue=1)
+    release = threading.Event()
+    try:
+        busy = [asyncio.ensure_future(pool.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        assert pool.stats()["in_flight"] == 1
+        assert pool.stats()["queued"] == 1
+        with pytest.raises(PasswordHasherBusyError):
+            await pool.run(release.wait)
+
+        release.set()
+        await asyncio.gather(*busy)
+    finally:
+        release.set()
+        pool.shutdown()
+
+    stats = pool.stats()
+    assert stats["rejected"] == 1
+    assert stats["completed"] == 2
+    assert stats["queued"] == 0
+
+
+async def test_verify_password_async():
+    hashed = await hash_password_async("HOLAmundo123")
+
+    assert await verify_password_async("HOLAmundo123", hashed)
+    assert not await verify_password_async("CHAOmundo123", hashed)
+
+
+def test_refresh_token_hash_is_deterministic():
+    token = generate_refresh_token()
+
+    assert hash_refresh_token(token) == hash_refresh_token(token)
+    assert hash_refresh_token(token) != hash_refresh_token(generate_refresh_token())
+    assert token not in hash_refresh_token(token)
+
+
+def test_outdated_hash_is_rehashed_on_verify():
+    old_hash = Argon2Hasher(time_cost=1, memory_cost=8192, parallelism=1).hash("HOLAmundo123")
+
+    valid, new_hash = verify_and_update_password("HOLAmundo123", old_hash)
+
+    assert valid
+    assert new_hash is not None
+    assert not password_hash.current_hasher.check_needs_rehash(new_hash)
+
+
+def test_current_hash_is_not_rehashed():
+    valid, new_hash = verify_and_update_password("HOLAmundo123", hash_password("HOLAmundo123"))
+
+    assert valid
+    assert new_hash is None
+
+
+def test_decode_verifies_signature_once_per_token(monkeypatch):
+    token = create_access_token({"sub": "usuario@test.com"})
+    calls = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(1)
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+
+    first = decode_access_token(token)
+    second = decode_access_token(token)
+
+    assert first["sub"] == second["sub"] == "usuario@test.com"
+    assert len(calls) == 1
+
+
+def test_decode_cache_expires_with_token(monkeypatch):
+    token = create_access_token({"sub": "usuario@test.com"})
+    decode_access_token(token)
+    calls = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(1)
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + settings.jwt_expire_min * 60 + 1)
+
+    # Pasado el exp la entrada ya no sirve y se vuelve a verificar
+    decode_access_token(token)
+    assert len(calls) == 1
+
+
+def test_decode_does_not_cache_invalid_tokens():
+    token = create_access_token({"sub": "usuario@test.com"})
+
+    with pytest.raises(jwt.InvalidTokenError):
+        decode_access_token(token[:-2] + "xx")
+
+
+def test_api_key_digest_is_keyed():
+    api_key = generate_api_key()
+
+    assert api_key.startswith("bgk_")
+    assert hash_api_key(api_key) == hash_api_key(api_key)
+    assert hash_api_key(api_key) != hashlib.sha256(api_key.encode()).hexdigest()